@@ -1,11 +1,16 @@
 import re
+import time
+import hashlib
+import inspect
+import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Iterable
 
 import duckdb
+import fastexcel
 import polars as pl
-from openpyxl import load_workbook
 
 # ----------------
 # Logging
@@ -39,6 +44,8 @@ def cast_inches(value: str | None) -> float | None:
     m = re.fullmatch(r"(\d+)-(\d+)/(\d+)", value)
     if m:
         whole, num, den = m.groups()
+        if float(den) == 0:
+            return None
         return float(whole) + float(num) / float(den)
 
     # Case: decimal (e.g. 2.75)
@@ -48,17 +55,40 @@ def cast_inches(value: str | None) -> float | None:
     return None
 
 
+_MIXED_FRACTION = r"^(\d+)-(\d+)/(\d+)$"
+_DECIMAL = r"^\d+(\.\d+)?$"
+
+
+def cast_inches_expr(column: str) -> pl.Expr:
+    """
+    Native Polars equivalent of cast_inches, evaluated in the Rust engine.
+    """
+    value = pl.col(column).cast(pl.Utf8).str.strip_chars()
+
+    whole, num, den = (
+        value.str.extract(_MIXED_FRACTION, group).cast(pl.Float64)
+        for group in (1, 2, 3)
+    )
+
+    # A zero denominator is bad data, not an infinite dimension
+    return (
+        pl.when(value.str.contains(_MIXED_FRACTION) & (den == 0))
+        .then(None)
+        .when(value.str.contains(_MIXED_FRACTION))
+        .then(whole + num / den)
+        .when(value.str.contains(_DECIMAL))
+        .then(value.cast(pl.Float64, strict=False))
+        .otherwise(None)
+        .alias(column)
+    )
+
+
 # ----------------
 # Sheet →  DataFrame
 # ----------------
 
 
-def load_and_clean_sheet(
-    excel_path: Path,
-    sheet_name: str,
-) -> pl.DataFrame:
-    df = pl.read_excel(excel_path, sheet_name=sheet_name)
-
+def clean_sheet(df: pl.DataFrame) -> pl.DataFrame:
     if df.is_empty():
         return df
 
@@ -73,6 +103,43 @@ def load_and_clean_sheet(
     return df
 
 
+def load_and_clean_sheet(
+    excel_path: Path,
+    sheet_name: str,
+) -> pl.DataFrame:
+    df = pl.read_excel(excel_path, sheet_name=sheet_name)
+    return clean_sheet(df)
+
+
+def _sheet_to_frame(batch) -> pl.DataFrame:
+    """
+    Wrap a fastexcel Arrow batch without copying, applying the same
+    adjustments pl.read_excel makes on top of fastexcel: drop unnamed
+    all-null columns and read integral float columns back as integers.
+    """
+    df = pl.DataFrame(batch)
+
+    df = df.drop(
+        c
+        for c in df.columns
+        if re.fullmatch(r"__UNNAMED__\d+", c) and df[c].null_count() == df.height
+    )
+
+    floats = [c for c, dtype in df.schema.items() if dtype.is_float()]
+    if floats and not df.is_empty():
+        integral = df.select(
+            (pl.col(c).floor().eq_missing(pl.col(c)) & pl.col(c).is_not_nan()).all(
+                ignore_nulls=True
+            )
+            for c in floats
+        ).row(0)
+        df = df.with_columns(
+            pl.col(c).cast(pl.Int64) for c, ok in zip(floats, integral) if ok
+        )
+
+    return df
+
+
 # ----------------
 # Extract ALL sheets (no DB)
 # ----------------
@@ -80,30 +147,106 @@ def load_and_clean_sheet(
 
 def extract_sheets(
     excel_path: Path,
+    workers: int | None = None,
 ) -> Dict[str, pl.DataFrame]:
-    wb = load_workbook(excel_path, read_only=True)
-    sheet_names = wb.sheetnames
-    wb.close()
-
-    tables: Dict[str, pl.DataFrame] = {}
+    """
+    Read and clean every sheet of the workbook.
+    The workbook is opened once and its sheets are read, one after another,
+    from that single reader (a fastexcel reader cannot be shared between
+    threads); the Arrow batches are then converted and cleaned concurrently.
+    """
+    reader = fastexcel.read_excel(Path(excel_path).read_bytes())
+    sheet_names = reader.sheet_names
 
+    batches = []
     for sheet in sheet_names:
-        logger.info(f"▶ Loading sheet: {sheet}")
+        start = time.perf_counter()
+        batches.append((reader.load_sheet_eager(sheet), time.perf_counter() - start))
 
-        df = load_and_clean_sheet(excel_path, sheet)
+    def load(item) -> tuple[pl.DataFrame, float]:
+        batch, elapsed = item
+        start = time.perf_counter()
+        df = clean_sheet(_sheet_to_frame(batch))
+        return df, elapsed + time.perf_counter() - start
 
-        if df.is_empty():
-            logger.info("  ↳ skipped (empty)")
-            continue
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        loaded = pool.map(load, batches)
+
+        tables: Dict[str, pl.DataFrame] = {}
+
+        for sheet, (df, elapsed) in zip(sheet_names, loaded):
+            logger.info(f"▶ Loading sheet: {sheet}")
 
-        table_name = f"aisc_{regex_clean(sheet)}"
-        tables[table_name] = df
+            if df.is_empty():
+                logger.info(f"  ↳ skipped (empty, {elapsed:.3f} s)")
+                continue
 
-        logger.info(f"  ↳ loaded → {table_name} ({df.height} rows)")
+            table_name = f"aisc_{regex_clean(sheet)}"
+            tables[table_name] = df
+
+            logger.info(
+                f"  ↳ loaded → {table_name} ({df.height} rows, {elapsed:.3f} s)"
+            )
 
     return tables
 
 
+# ----------------
+# Content hashes
+# ----------------
+
+META_TABLE = "_migration"
+WORKBOOK_KEY = "__workbook__"
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def frame_hash(df: pl.DataFrame) -> str:
+    """
+    Hash of a table's content (schema and values), via its Arrow IPC bytes.
+    """
+    return hashlib.sha256(df.write_ipc(None).getvalue()).hexdigest()
+
+
+def step_hash(*steps: Callable) -> str:
+    """
+    Hash of the code that turns a sheet into a table, so editing a
+    normalization step rebuilds the tables it touches.
+    """
+    digest = hashlib.sha256(pl.__version__.encode())
+    for step in steps:
+        digest.update(inspect.getsource(step).encode())
+    return digest.hexdigest()
+
+
+def read_migration_state(db_path: Path) -> Dict[str, tuple[str, str]]:
+    """
+    name → (content hash, step hash) recorded by the last migration.
+    """
+    if not Path(db_path).exists():
+        return {}
+
+    with duckdb.connect(db_path, read_only=True) as con:
+        exists = con.execute(
+            "SELECT count(*) FROM information_schema.tables WHERE table_name = ?",
+            [META_TABLE],
+        ).fetchone()[0]
+        if not exists:
+            return {}
+
+        rows = con.execute(
+            f"SELECT name, content_hash, step_hash FROM {META_TABLE}"
+        ).fetchall()
+
+    return {name: (content, step) for name, content, step in rows}
+
+
 # ----------------
 # Persistence (DB only)
 # ----------------
@@ -113,19 +256,125 @@ def save_tables(
     tables: Dict[str, pl.DataFrame],
     db_path: Path,
     replace: bool = True,
+    hashes: Dict[str, tuple[str, str]] | None = None,
 ):
+    """
+    Each table is first written to a staging table; then, in a single
+    transaction, the old tables are dropped, the staging tables renamed
+    and the hashes recorded. Readers see either the old catalog or the
+    new one, never a half-written one.
+    """
+    hashes = hashes or {}
+
     with duckdb.connect(db_path) as con:
+        con.execute(
+            f"CREATE TABLE IF NOT EXISTS {META_TABLE} ("
+            "name VARCHAR PRIMARY KEY, content_hash VARCHAR, step_hash VARCHAR, "
+            "rows BIGINT, updated_at TIMESTAMP)"
+        )
+
         for table_name, df in tables.items():
             logger.info(f"▶ Writing table: {table_name}")
 
-            if replace:
-                con.execute(f"DROP TABLE IF EXISTS {table_name}")
-
+            con.execute(f"DROP TABLE IF EXISTS {table_name}__staging")
             con.register("tmp_df", df)
-            con.execute(f"CREATE TABLE {table_name} AS SELECT * FROM tmp_df")
+            con.execute(f"CREATE TABLE {table_name}__staging AS SELECT * FROM tmp_df")
             con.unregister("tmp_df")
 
-            logger.info(f"  ↳ written ({df.height} rows)")
+            logger.info(f"  ↳ staged ({df.height} rows)")
+
+        con.execute("BEGIN TRANSACTION")
+        try:
+            for table_name, df in tables.items():
+                if replace:
+                    con.execute(f"DROP TABLE IF EXISTS {table_name}")
+                con.execute(f"ALTER TABLE {table_name}__staging RENAME TO {table_name}")
+
+                if table_name in hashes:
+                    con.execute(
+                        f"INSERT OR REPLACE INTO {META_TABLE} "
+                        "VALUES (?, ?, ?, ?, current_timestamp)",
+                        [table_name, *hashes[table_name], df.height],
+                    )
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+
+        logger.info(f"  ↳ swapped in {len(tables)} tables")
+
+
+def drop_tables(db_path: Path, table_names: Iterable[str]) -> None:
+    """
+    Drop tables (and their migration records) in a single transaction.
+    """
+    table_names = list(table_names)
+    if not table_names:
+        return
+
+    with duckdb.connect(db_path) as con:
+        con.execute("BEGIN TRANSACTION")
+        try:
+            for table_name in table_names:
+                logger.info(f"▶ Dropping table: {table_name}")
+                con.execute(f"DROP TABLE IF EXISTS {table_name}")
+                con.execute(f"DELETE FROM {META_TABLE} WHERE name = ?", [table_name])
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+
+
+def record_workbook_hash(db_path: Path, content: str, step: str) -> None:
+    with duckdb.connect(db_path) as con:
+        con.execute(
+            f"INSERT OR REPLACE INTO {META_TABLE} "
+            "VALUES (?, ?, ?, NULL, current_timestamp)",
+            [WORKBOOK_KEY, content, step],
+        )
+
+
+# ----------------
+# Arrow IPC export
+# ----------------
+
+
+def arrow_path(db_path: Path, table_name: str) -> Path:
+    return Path(db_path).parent / f"{table_name}.arrow"
+
+
+def export_arrow(db_path: Path, table_names: Iterable[str]) -> list[Path]:
+    """
+    Write each table as an uncompressed Arrow IPC file next to the database,
+    so readers can memory-map it instead of copying it out of DuckDB. Files
+    are written under a temporary name and then moved into place.
+    """
+    table_names = list(table_names)
+    if not table_names:
+        return []
+
+    paths: list[Path] = []
+
+    with duckdb.connect(db_path, read_only=True) as con:
+        for table_name in table_names:
+            path = arrow_path(db_path, table_name)
+            tmp = path.with_suffix(".arrow.tmp")
+
+            con.execute(f"SELECT * FROM {table_name}").pl().write_ipc(
+                tmp, compression="uncompressed"
+            )
+            os.replace(tmp, path)
+            paths.append(path)
+
+            logger.info(f"  ↳ exported → {path.name}")
+
+    return paths
+
+
+def discard_arrow(db_path: Path, table_names: Iterable[str]) -> None:
+    # A table about to change must not be read from its old Arrow file
+    for table_name in table_names:
+        arrow_path(db_path, table_name).unlink(missing_ok=True)
 
 
 def normalize_aisc_tables(
@@ -166,8 +415,8 @@ def normalize_aisc_tables(
 
 def normalize_wsmhp_table(df: pl.DataFrame) -> pl.DataFrame:
     df = df.with_columns(
-        pl.col("gage").map_elements(cast_inches, return_dtype=pl.Float64).alias("gage"),
-        pl.col("t").map_elements(cast_inches, return_dtype=pl.Float64).alias("t"),
+        cast_inches_expr("gage"),
+        cast_inches_expr("t"),
         pl.col("fy").cast(pl.Float64, strict=False).alias("fy"),
     )
 
@@ -176,8 +425,8 @@ def normalize_wsmhp_table(df: pl.DataFrame) -> pl.DataFrame:
 
 def normalize_cmc_table(df: pl.DataFrame) -> pl.DataFrame:
     df = df.with_columns(
-        pl.col("gage").map_elements(cast_inches, return_dtype=pl.Float64).alias("gage"),
-        pl.col("t").map_elements(cast_inches, return_dtype=pl.Float64).alias("t"),
+        cast_inches_expr("gage"),
+        cast_inches_expr("t"),
     )
 
     return df
@@ -190,6 +439,32 @@ def normalize_angles_table(df: pl.DataFrame) -> pl.DataFrame:
     return df
 
 
+NORMALIZERS: Dict[str, Callable[[pl.DataFrame], pl.DataFrame]] = {
+    "wsmhp": normalize_wsmhp_table,
+    "cmc": normalize_cmc_table,
+    # wt tables was already normalized
+    "angles": normalize_angles_table,
+    # two_angles was already normalized
+    # tubes was already normalized
+    # pipes was already normalized
+}
+
+_COMMON_STEPS = (
+    _sheet_to_frame,
+    clean_sheet,
+    regex_clean,
+    normalize_aisc_tables,
+    cast_inches_expr,
+)
+
+
+def table_step_hash(table_name: str) -> str:
+    steps = _COMMON_STEPS
+    if table_name in NORMALIZERS:
+        steps = (*steps, NORMALIZERS[table_name])
+    return step_hash(*steps)
+
+
 # ----------------
 # Entry point
 # ----------------
@@ -198,7 +473,35 @@ def normalize_angles_table(df: pl.DataFrame) -> pl.DataFrame:
 def migrate_excel_to_duckdb(
     excel_path: Path,
     db_path: Path,
+    force: bool = False,
 ) -> Dict[str, pl.DataFrame]:
+    """
+    Incremental migration. An unchanged workbook is a no-op; otherwise each
+    sheet's content hash and the hash of its normalization steps decide
+    whether its table is rebuilt, and tables whose sheet is no longer in the
+    workbook are dropped. `force` rebuilds everything. Every table is also
+    kept as an Arrow IPC file in the database folder.
+
+    Returns only the tables (re)written by this call, not the whole
+    catalog: an empty dict means nothing changed. Read the other tables
+    through megara.secciones.SectionCatalog.
+    """
+    recorded = read_migration_state(db_path)
+    state = {} if force else recorded
+    workbook = (file_hash(excel_path), step_hash(*_COMMON_STEPS, *NORMALIZERS.values()))
+
+    if state.get(WORKBOOK_KEY) == workbook:
+        export_arrow(
+            db_path,
+            (
+                name
+                for name in state
+                if name != WORKBOOK_KEY and not arrow_path(db_path, name).exists()
+            ),
+        )
+        logger.info("✔ Catalog up to date, nothing to migrate")
+        return {}
+
     tables = extract_sheets(excel_path)
 
     # --------------------------------
@@ -210,15 +513,35 @@ def migrate_excel_to_duckdb(
 
     tables = normalize_aisc_tables(tables)
 
-    tables["wsmhp"] = normalize_wsmhp_table(tables["wsmhp"])
-    tables["cmc"] = normalize_cmc_table(tables["cmc"])
-    # wt tables was already normalized
-    tables["angles"] = normalize_angles_table(tables["angles"])
-    # two_angles was already normalized
-    # tubes was already normalized
-    # pipes was already normalized
+    changed: Dict[str, pl.DataFrame] = {}
+    hashes: Dict[str, tuple[str, str]] = {}
 
-    save_tables(tables, db_path)
-    logger.info("✔ Migration completed successfully")
+    for table_name, df in tables.items():
+        hashes[table_name] = (frame_hash(df), table_step_hash(table_name))
 
-    return tables
+        if state.get(table_name) == hashes[table_name]:
+            logger.info(f"▶ Unchanged table: {table_name}")
+            continue
+
+        normalize = NORMALIZERS.get(table_name)
+        changed[table_name] = normalize(df) if normalize else df
+
+    removed = [name for name in recorded if name != WORKBOOK_KEY and name not in tables]
+    discard_arrow(db_path, [*changed, *removed])
+    drop_tables(db_path, removed)
+    save_tables(changed, db_path, hashes=hashes)
+    export_arrow(
+        db_path,
+        (
+            name
+            for name in tables
+            if name in changed or not arrow_path(db_path, name).exists()
+        ),
+    )
+    record_workbook_hash(db_path, *workbook)
+    logger.info(
+        f"✔ Migration completed successfully ({len(changed)} of "
+        f"{len(tables)} tables rebuilt, {len(removed)} dropped)"
+    )
+
+    return changed
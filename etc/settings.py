@@ -4,13 +4,12 @@ import logging
 import logging.config
 from pathlib import Path
 
-import yaml
-
 from etc.paths import local_paths
 
 
 def load_logging_config(config_path: Path):
     """Load logging configuration from a YAML file."""
+    import yaml
 
     config_path = Path(config_path).resolve()
 
@@ -37,6 +36,10 @@ def handle_uncaught_exceptions(exc_type, exc_value, exc_traceback):
 
 def setup_logging():
     """Load logging settings to the entire application."""
-    locale.setlocale(locale.LC_TIME, "es_PE.utf8")
+    try:
+        locale.setlocale(locale.LC_TIME, "es_PE.utf8")
+    except locale.Error:
+        # Hosts without the locale keep the default (English) dates
+        pass
     load_logging_config(local_paths.log_config)
     sys.excepthook = handle_uncaught_exceptions
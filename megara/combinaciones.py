@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Dict
 
+import numpy as np
+
 
 @dataclass
 class CombinacionCarga:
@@ -66,3 +68,109 @@ class CombinacionCarga:
         combos = self.combinations()
         tag = min(combos, key=lambda k: combos[k])
         return tag, combos[tag]
+
+
+# ---------------- MATRIX FORM ----------------
+
+LOAD_TYPES: tuple[str, ...] = ("D", "L", "Lr", "W", "S", "E", "R")
+
+
+def combination_matrix(
+    special_case: bool = False,
+) -> tuple[tuple[str, ...], np.ndarray]:
+    """
+    E.060 combinations as a (n_combinations × n_load_types) factor matrix,
+    with rows in the same order and tags as CombinacionCarga.combinations
+    and columns in LOAD_TYPES order.
+    """
+    L_corr = 1.0 if special_case else 0.5
+    rows: Dict[str, Dict[str, float]] = {}
+
+    # Combinación 1: 1.4D
+    rows["1"] = {"D": 1.4}
+
+    # Combinación 2: 1.2D * 1.6L + 0.5(Lr ó S ó R)
+    for name in ("Lr", "S", "R"):
+        rows[f"2-{name}"] = {"D": 1.2, "L": 1.6, name: 0.5}
+
+    # Combinación 3: 1.2D + 1.6(Lr ó S ó R) + (0,5L ó 0.8W)
+    for name in ("Lr", "S", "R"):
+        rows[f"3-{name}-L"] = {"D": 1.2, name: 1.6, "L": L_corr}
+        rows[f"3-{name}-W"] = {"D": 1.2, name: 1.6, "W": 0.8}
+
+    # Combinación 4: 1.2D ∓ 1.3W + 0.5L + 0.5(Lr ó S ó R)
+    for name in ("Lr", "S", "R"):
+        rows[f"4-{name}"] = {"D": 1.2, "W": 1.3, "L": L_corr, name: 0.5}
+
+    # Combinación 5: 1.2D ∓ 1.0E + 0.5L + 0.2S
+    rows["5-E+"] = {"D": 1.2, "E": 1.0, "L": L_corr, "S": 0.2}
+    rows["5-E-"] = {"D": 1.2, "E": -1.0, "L": L_corr, "S": 0.2}
+
+    # Combinación 6: 0.9D ∓ (1.3W ó 1.0E)
+    rows["6-W+"] = {"D": 0.9, "W": 1.3}
+    rows["6-W-"] = {"D": 0.9, "W": -1.3}
+    rows["6-E+"] = {"D": 0.9, "E": 1.0}
+    rows["6-E-"] = {"D": 0.9, "E": -1.0}
+
+    matrix = np.zeros((len(rows), len(LOAD_TYPES)))
+    for i, factors in enumerate(rows.values()):
+        for load, factor in factors.items():
+            matrix[i, LOAD_TYPES.index(load)] = factor
+
+    return tuple(rows), matrix
+
+
+@dataclass(frozen=True)
+class CombinationBatch:
+    """
+    Result of combine for n load cases.
+        - combined: (n_cases × n_combinations), columns in tags order
+        - max_index / min_index: envelope column for every row
+    """
+
+    tags: tuple[str, ...]
+    combined: np.ndarray
+    max_index: np.ndarray
+    min_index: np.ndarray
+
+    @property
+    def envelope_max(self) -> np.ndarray:
+        rows = np.arange(self.combined.shape[0])
+        return self.combined[rows, self.max_index]
+
+    @property
+    def envelope_min(self) -> np.ndarray:
+        rows = np.arange(self.combined.shape[0])
+        return self.combined[rows, self.min_index]
+
+    @property
+    def max_tags(self) -> np.ndarray:
+        return np.asarray(self.tags)[self.max_index]
+
+    @property
+    def min_tags(self) -> np.ndarray:
+        return np.asarray(self.tags)[self.min_index]
+
+
+def combine(loads, special_case: bool = False) -> CombinationBatch:
+    """
+    Apply every E.060 combination to a (n_cases × n_load_types) array of
+    service loads, columns in LOAD_TYPES order, with a single matmul.
+    Ties resolve to the first combination, as in CombinacionCarga.
+    """
+    loads = np.atleast_2d(np.asarray(loads, dtype=np.float64))
+    if loads.shape[-1] != len(LOAD_TYPES):
+        raise ValueError(
+            f"Expected {len(LOAD_TYPES)} load columns {LOAD_TYPES}, "
+            f"got {loads.shape[-1]}."
+        )
+
+    tags, matrix = combination_matrix(special_case)
+    combined = loads @ matrix.T
+
+    return CombinationBatch(
+        tags=tags,
+        combined=combined,
+        max_index=np.argmax(combined, axis=1),
+        min_index=np.argmin(combined, axis=1),
+    )
@@ -3,11 +3,11 @@ from dataclasses import dataclass
 from functools import cached_property
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from megara.flexión import Slenderness
 
 from .definiciones import Element
+from .traza import Traced
 from etc.paths import local_paths
 
 logger = logging.getLogger(__name__)
@@ -18,7 +18,7 @@ class CompressionValueNeeded(ValueError):
 
 
 @dataclass(frozen=True)
-class CompressedElement:
+class CompressedElement(Traced):
     element: Element
 
     # ----------------
@@ -26,15 +26,14 @@ class CompressedElement:
     # ----------------
 
     def __post_init__(self):
-        logger.info(
-            f"\n\n:: Applying compression to element {self.element.name}...\n"
-            + "-" * 45
-            + "\n"
+        self._info(
+            "\n\n:: Applying compression to element %s...\n" + "-" * 45 + "\n",
+            self.element.name,
         )
 
     @cached_property
     def phi(self) -> float:
-        logger.info("flexure ɸ : 0.9")
+        self._record("compression ɸ", 0.9)
         return 0.9
 
     @cached_property
@@ -44,7 +43,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "t" for element {self.element.section.shape}'
             )
-        logger.info(f"t : {self.element.section.t}")
+        self._record("t", self.element.section.t)
         return self.element.section.t
 
     @cached_property
@@ -54,7 +53,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "tw" for element {self.element.section.shape}'
             )
-        logger.info(f"tw : {self.element.section.tw}")
+        self._record("tw", self.element.section.tw)
         return self.element.section.tw
 
     @cached_property
@@ -64,7 +63,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "bf" for element {self.element.section.shape}'
             )
-        logger.info(f"bf : {self.element.section.bf}")
+        self._record("bf", self.element.section.bf)
         return self.element.section.bf
 
     @cached_property
@@ -74,7 +73,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "tf" for element {self.element.section.shape}'
             )
-        logger.info(f"tf : {self.element.section.tf}")
+        self._record("tf", self.element.section.tf)
         return self.element.section.tf
 
     @cached_property
@@ -84,7 +83,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "rx" for element {self.element.section.shape}'
             )
-        logger.info(f"rx : {self.element.section.rx}")
+        self._record("rx", self.element.section.rx)
         return self.element.section.rx
 
     @cached_property
@@ -94,7 +93,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "ry" for element {self.element.section.shape}'
             )
-        logger.info(f"ry : {self.element.section.ry}")
+        self._record("ry", self.element.section.ry)
         return self.element.section.ry
 
     @cached_property
@@ -104,7 +103,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "A" for element {self.element.section.shape}'
             )
-        logger.info(f"A : {self.element.section.a}")
+        self._record("A", self.element.section.a)
         return self.element.section.a
 
     # ----------------
@@ -118,7 +117,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "Kx" for element {self.element.section.shape}'
             )
-        logger.info(f"Kx : {self.element.Kx}")
+        self._record("Kx", self.element.Kx)
         return self.element.Kx
 
     @cached_property
@@ -128,7 +127,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "Ky" for element {self.element.section.shape}'
             )
-        logger.info(f"Ky : {self.element.Ky}")
+        self._record("Ky", self.element.Ky)
         return self.element.Ky
 
     @cached_property
@@ -138,7 +137,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "L" for element {self.element.section.shape}'
             )
-        logger.info(f"L : {self.element.L}")
+        self._record("L", self.element.L)
         return self.element.L
 
     @cached_property
@@ -148,7 +147,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "E" for element {self.element.section.shape}'
             )
-        logger.info(f"E : {self.element.material.E}")
+        self._record("E", self.element.material.E)
         return self.element.material.E
 
     @cached_property
@@ -158,7 +157,7 @@ class CompressedElement:
             raise CompressionValueNeeded(
                 f'Missing parameter "Fy" for element {self.element.section.shape}'
             )
-        logger.info(f"Fy : {self.element.material.Fy}")
+        self._record("Fy", self.element.material.Fy)
         return self.element.material.Fy
 
     # ----------------
@@ -168,25 +167,25 @@ class CompressedElement:
     @cached_property
     def lambda_web(self) -> float:
         value = self.t / self.tw
-        logger.info(f"λ_web : {value}")
+        self._record("λ_web", value)
         return value
 
     @cached_property
     def lambda_flange(self) -> float:
         value = self.bf / (2 * self.tf)
-        logger.info(f"λ_flange : {value}")
+        self._record("λ_flange", value)
         return value
 
     @cached_property
     def lambda_r_web(self) -> float:
         value = 1.49 * np.sqrt(self.E / self.Fy)
-        logger.info(f"λ_r_web : {value}")
+        self._record("λ_r_web", value)
         return value
 
     @cached_property
     def lambda_r_flange(self) -> float:
         value = 0.56 * np.sqrt(self.E / self.Fy)
-        logger.info(f"λ_r_flange : {value}")
+        self._record("λ_r_flange", value)
         return value
 
     @cached_property
@@ -198,19 +197,19 @@ class CompressedElement:
             slenderness = Slenderness.compact
         else:
             slenderness = Slenderness.slender
-        logger.info(f"Local slenderness : {slenderness}")
+        self._record("Local slenderness", slenderness)
         return slenderness
 
     @cached_property
     def slenderness_x(self) -> float:
         value = self.Kx * self.L / self.rx
-        logger.info(f"KL/rx : {value}")
+        self._record("KL/rx", value)
         return value
 
     @cached_property
     def slenderness_y(self) -> float:
         value = self.Ky * self.L / self.ry
-        logger.info(f"KL/ry : {value}")
+        self._record("KL/ry", value)
         return value
 
     @cached_property
@@ -219,7 +218,7 @@ class CompressedElement:
             slenderness = Slenderness.compact
         else:
             slenderness = Slenderness.slender
-        logger.info(f"Global slenderness : {slenderness}")
+        self._record("Global slenderness", slenderness)
         return slenderness
 
     # ----------------
@@ -229,12 +228,12 @@ class CompressedElement:
     @cached_property
     def buckling_limit(self) -> float:
         value = 4.71 * np.sqrt(self.E / self.Fy)
-        logger.info(f"buckling limit : {value}")
+        self._record("buckling limit", value)
         return value
 
     def euler_buckling_stress(self, slenderness: float) -> float:
         value = np.pi**2 * self.E / slenderness**2
-        logger.debug(f"Euler buckling stress for {slenderness} : {value}")
+        self._debug("Euler buckling stress for %s : %s", slenderness, value)
         return value
 
     def critical_buckling_stress(self, slenderness: float) -> float:
@@ -244,7 +243,7 @@ class CompressedElement:
             ) * self.Fy
         else:
             value = 0.877 * self.euler_buckling_stress(slenderness)
-        logger.debug(f"Critical buckling stress for {slenderness} : {value}")
+        self._debug("Critical buckling stress for %s : %s", slenderness, value)
         return value
 
     @cached_property
@@ -257,7 +256,7 @@ class CompressedElement:
                 self.critical_buckling_stress(self.slenderness_x),
                 self.critical_buckling_stress(self.slenderness_y),
             )
-            logger.info(f"Fcr : {value}")
+            self._record("Fcr", value)
             return value
         else:
             raise ValueError("Check local or global slenderness.")
@@ -265,25 +264,34 @@ class CompressedElement:
     @cached_property
     def phi_Fcr(self) -> float:
         value = self.phi * self.Fcr
-        logger.info(f"ɸFcr : {value}")
+        self._record("ɸFcr", value)
         return value
 
     @cached_property
     def phi_Pn(self) -> float:
         value = self.A * self.phi_Fcr
-        logger.info(f"ɸPn : {value}")
+        self._record("ɸPn", value)
         return value
 
     # ----------------
     # Plot
     # ----------------
 
-    @property
-    def _phi_Pn_figure(self):
+    @cached_property
+    def _phi_Pn_curve(self) -> tuple[np.ndarray, np.ndarray]:
         slenderness = np.linspace(1, 200, 400)
-        phi_Pn_vals = np.array(
-            [self.phi * self.A * self.critical_buckling_stress(s) for s in slenderness]
+        phi_Pn_vals = (
+            self.phi
+            * self.A
+            * critical_buckling_stress_batch(slenderness, self.Fy, self.E)
         )
+        return slenderness, phi_Pn_vals
+
+    @property
+    def _phi_Pn_figure(self):
+        import matplotlib.pyplot as plt
+
+        slenderness, phi_Pn_vals = self._phi_Pn_curve
 
         fig, ax = plt.subplots()
 
@@ -370,11 +378,117 @@ class CompressedElement:
         return fig, ax
 
     def show_phi_Pn_curve(self):
+        import matplotlib.pyplot as plt
+
         _, _ = self._phi_Pn_figure
         plt.show()
 
     def save_phi_Pn_curve(self, dpi: int = 300):
+        import matplotlib.pyplot as plt
+
         fig, _ = self._phi_Pn_figure
         path = local_paths.cache / f"{self.element.name}_compression.png"
         fig.savefig(path, dpi=dpi, bbox_inches="tight")
         plt.close(fig)
+
+
+# ----------------
+# Batch
+# ----------------
+
+
+@dataclass(frozen=True)
+class CompressionBatch:
+    """
+    Columnar result of compression_batch; every field is an array with the
+    broadcast shape of the inputs.
+        - local_slender: flange or web fails the local slenderness limits
+        - global_slender: KL/rx or KL/ry is not below 200
+        - valid: rows where CompressedElement.Fcr would not raise;
+          Fcr, phi_Fcr and phi_Pn are NaN elsewhere
+    """
+
+    slenderness_x: np.ndarray
+    slenderness_y: np.ndarray
+    Fcr: np.ndarray
+    phi_Fcr: np.ndarray
+    phi_Pn: np.ndarray
+    local_slender: np.ndarray
+    global_slender: np.ndarray
+    valid: np.ndarray
+
+
+def critical_buckling_stress_batch(slenderness, Fy, E) -> np.ndarray:
+    """
+    Vectorized CompressedElement.critical_buckling_stress.
+    """
+    slenderness, Fy, E = np.broadcast_arrays(
+        np.asarray(slenderness, dtype=np.float64),
+        np.asarray(Fy, dtype=np.float64),
+        np.asarray(E, dtype=np.float64),
+    )
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        Fe = np.pi**2 * E / slenderness**2
+        buckling_limit = 4.71 * np.sqrt(E / Fy)
+        return np.where(
+            slenderness <= buckling_limit,
+            (0.658 ** (Fy / Fe)) * Fy,
+            0.877 * Fe,
+        )
+
+
+def compression_batch(
+    a,
+    rx,
+    ry,
+    bf,
+    tf,
+    tw,
+    t,
+    L,
+    Kx,
+    Ky,
+    Fy,
+    E,
+) -> CompressionBatch:
+    """
+    Vectorized counterpart of CompressedElement.phi_Pn.
+    Inputs broadcast against each other, so sections, lengths and K factors
+    can be swept on separate axes. Slenderness failures are reported through
+    the status masks instead of raising.
+    """
+    a, rx, ry, bf, tf, tw, t, L, Kx, Ky, Fy, E = (
+        np.asarray(x, dtype=np.float64)
+        for x in np.broadcast_arrays(a, rx, ry, bf, tf, tw, t, L, Kx, Ky, Fy, E)
+    )
+    phi = 0.9
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # ---- Slenderness
+        root = np.sqrt(E / Fy)
+        local_compact = (bf / (2 * tf) < 0.56 * root) & (t / tw < 1.49 * root)
+
+        slenderness_x = Kx * L / rx
+        slenderness_y = Ky * L / ry
+        global_compact = (slenderness_x < 200) & (slenderness_y < 200)
+
+        valid = local_compact & global_compact
+
+        # ---- Buckling
+        Fcr = np.minimum(
+            critical_buckling_stress_batch(slenderness_x, Fy, E),
+            critical_buckling_stress_batch(slenderness_y, Fy, E),
+        )
+        Fcr = np.where(valid, Fcr, np.nan)
+        phi_Fcr = phi * Fcr
+
+    return CompressionBatch(
+        slenderness_x=slenderness_x,
+        slenderness_y=slenderness_y,
+        Fcr=Fcr,
+        phi_Fcr=phi_Fcr,
+        phi_Pn=a * phi_Fcr,
+        local_slender=~local_compact,
+        global_slender=~global_compact,
+        valid=valid,
+    )
@@ -3,9 +3,9 @@ from dataclasses import dataclass
 from functools import cached_property
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from .definiciones import Element
+from .traza import Traced
 from etc.paths import local_paths
 
 
@@ -17,7 +17,7 @@ class ShearValueNeeded(ValueError):
 
 
 @dataclass(frozen=True)
-class ShearedElement:
+class ShearedElement(Traced):
     """
     Element to be sheared.
         - element: beam to be checked for shear strength
@@ -34,10 +34,9 @@ class ShearedElement:
     # ----------------
 
     def __post_init__(self):
-        logger.info(
-            f"\n\n:: Applying shear to element {self.element.name}...\n"
-            + "-" * 45
-            + "\n"
+        self._info(
+            "\n\n:: Applying shear to element %s...\n" + "-" * 45 + "\n",
+            self.element.name,
         )
 
     @cached_property
@@ -47,7 +46,7 @@ class ShearedElement:
             raise ShearValueNeeded(
                 f'Missing parameter "shape" for element {self.element.section.shape}.'
             )
-        logger.info(f"shape : {self.element.section.shape}")
+        self._record("shape", self.element.section.shape)
         return self.element.section.shape
 
     @cached_property
@@ -57,7 +56,7 @@ class ShearedElement:
             raise ShearValueNeeded(
                 f'Missing parameter "d" for element {self.element.section.shape}.'
             )
-        logger.info(f"d : {self.element.section.d}")
+        self._record("d", self.element.section.d)
         return self.element.section.d
 
     @cached_property
@@ -67,7 +66,7 @@ class ShearedElement:
             raise ShearValueNeeded(
                 f'Missing parameter "h = t" for element {self.element.section.shape}.'
             )
-        logger.info(f"h : {self.element.section.t}")
+        self._record("h", self.element.section.t)
         return self.element.section.t
 
     @cached_property
@@ -77,7 +76,7 @@ class ShearedElement:
             raise ShearValueNeeded(
                 f'Missing parameter "tw" for element {self.element.section.shape}.'
             )
-        logger.info(f"tw : {self.element.section.tw}")
+        self._record("tw", self.element.section.tw)
         return self.element.section.tw
 
     @cached_property
@@ -87,7 +86,7 @@ class ShearedElement:
             raise ShearValueNeeded(
                 f'Missing parameter "bf" for element {self.element.section.shape}.'
             )
-        logger.info(f"bf : {self.element.section.bf}")
+        self._record("bf", self.element.section.bf)
         return self.element.section.bf
 
     @cached_property
@@ -97,7 +96,7 @@ class ShearedElement:
             raise ShearValueNeeded(
                 f'Missing parameter "tf" for element {self.element.section.shape}.'
             )
-        logger.info(f"tf : {self.element.section.tf}")
+        self._record("tf", self.element.section.tf)
         return self.element.section.tf
 
     @cached_property
@@ -107,7 +106,7 @@ class ShearedElement:
             raise ShearValueNeeded(
                 f'Missing parameter "zx" for element {self.element.section.shape}.'
             )
-        logger.info(f"tw : {self.element.section.zx}")
+        self._record("zx", self.element.section.zx)
         return self.element.section.zx
 
     # ----------------
@@ -121,7 +120,7 @@ class ShearedElement:
             raise ShearValueNeeded(
                 f'Missing parameter "E" for element {self.element.section.shape}.'
             )
-        logger.info(f"E : {self.element.material.E}")
+        self._record("E", self.element.material.E)
         return self.element.material.E
 
     @cached_property
@@ -131,7 +130,7 @@ class ShearedElement:
             raise ShearValueNeeded(
                 f'Missing parameter "Fy" for element {self.element.section.shape}.'
             )
-        logger.info(f"Fy : {self.element.material.Fy}")
+        self._record("Fy", self.element.material.Fy)
         return self.element.material.Fy
 
     # ----------------
@@ -141,7 +140,7 @@ class ShearedElement:
     @cached_property
     def _lambda_w(self) -> float:
         _lambda = self.h / self.tw
-        logger.info(f"λ_w : {_lambda}")
+        self._record("λ_w", _lambda)
         return _lambda
 
     @cached_property
@@ -158,7 +157,7 @@ class ShearedElement:
             value = 1.10 * np.sqrt(self.kv * self.E / self.Fy)
         else:
             raise ShearValueNeeded("Unsupported shape for shear")
-        logger.info(f"λr : {value}")
+        self._record("λr", value)
         return value
 
     # ----------------
@@ -168,7 +167,7 @@ class ShearedElement:
     @cached_property
     def Aw(self) -> float:
         value = self.d * self.tw
-        logger.info(f"Aw : {value}")
+        self._record("Aw", value)
         return value
 
     @cached_property
@@ -177,7 +176,7 @@ class ShearedElement:
             value = 5.34
         else:
             value = 5 + 5 / (self.a / self.h) ** 2
-        logger.info(f"Kv : {value}")
+        self._record("Kv", value)
         return value
 
     @cached_property
@@ -186,7 +185,7 @@ class ShearedElement:
             value = 1
         else:
             value = 1.10 * np.sqrt(self.kv * self.E / self.Fy) / (self._lambda_w)
-        logger.info(f"Cv : {value}")
+        self._record("Cv", value)
         return value
 
     @cached_property
@@ -197,7 +196,7 @@ class ShearedElement:
             )
 
         value = 0.6 * self.Fy * self.Aw * self.cv
-        logger.info(f"Vn : {value}")
+        self._record("Vn", value)
         return value
 
     @cached_property
@@ -208,7 +207,7 @@ class ShearedElement:
             value = 0.9
         else:
             raise ShearValueNeeded("Unsupported shape for shear")
-        logger.info(f"ɸ_v : {value}")
+        self._record("ɸ_v", value)
         return value
 
     @cached_property
@@ -227,8 +226,9 @@ class ShearedElement:
 
     @cached_property
     def arriostre_lateral_d(self) -> float:
-        logger.info(f"Mínimo peralte del arriostre lateral: {self.element.section.zx}")
-        return self.d / 3
+        value = self.d / 3
+        self._record("Mínimo peralte del arriostre lateral", value)
+        return value
 
     @cached_property
     def F_br(self) -> float:
@@ -248,29 +248,33 @@ class ShearedElement:
         Pf = C / self.ejes_arriostres_laterales
         # ^^^ I think it should always be 2, but whatever
         Fbr = Pf * 0.02
-        logger.info(f"Fuerza aplicada como compresión al arriostre: {Fbr}")
+        self._record("Fuerza aplicada como compresión al arriostre", Fbr)
         return Fbr
 
     # ----------------
     # Plot
     # ----------------
 
-    def _cv_from_lambda(self, lambda_w: float) -> float:
-        if lambda_w <= self._lambda_r:
-            return 1.0
-        return 1.10 * np.sqrt(self.kv * self.E / self.Fy) / lambda_w
+    def _cv_from_lambda(self, lambda_w):
+        return np.where(
+            lambda_w <= self._lambda_r,
+            1.0,
+            1.10 * np.sqrt(self.kv * self.E / self.Fy) / lambda_w,
+        )
 
-    @property
-    def _phi_Vn_figure(self):
+    @cached_property
+    def _phi_Vn_curve(self) -> tuple[np.ndarray, np.ndarray]:
         # ---- Slenderness range
         lambda_vals = np.linspace(1, 250, 500)
 
-        Vn_vals = np.array(
-            [
-                self.phi * 0.6 * self.Fy * self.Aw * self._cv_from_lambda(lw)
-                for lw in lambda_vals
-            ]
-        )
+        Vn_vals = self.phi * 0.6 * self.Fy * self.Aw * self._cv_from_lambda(lambda_vals)
+        return lambda_vals, Vn_vals
+
+    @property
+    def _phi_Vn_figure(self):
+        import matplotlib.pyplot as plt
+
+        lambda_vals, Vn_vals = self._phi_Vn_curve
 
         fig, ax = plt.subplots()
 
@@ -340,6 +344,8 @@ class ShearedElement:
         return fig, ax
 
     def show_Vn_curve(self):
+        import matplotlib.pyplot as plt
+
         _, _ = self._phi_Vn_figure
         plt.show()
 
@@ -347,11 +353,97 @@ class ShearedElement:
         self,
         dpi: int = 300,
     ):
+        import matplotlib.pyplot as plt
+
         fig, _ = self._phi_Vn_figure
         path = local_paths.cache / f"{self.element.name}_shear.png"
         fig.savefig(path, dpi=dpi, bbox_inches="tight")
         plt.close(fig)
 
 
+# ----------------
+# Batch
+# ----------------
+
+ROLLED_SHAPES = ("W", "S", "M", "H")
+CHANNEL_SHAPES = ("C",)
+
+
+@dataclass(frozen=True)
+class ShearBatch:
+    """
+    Columnar result of shear_batch; every field is an array with the
+    broadcast shape of the inputs.
+        - supported: shape family is W/S/M/H or C
+        - tension_field: a / h <= 3, which ShearedElement.Vn does not cover
+          (Vn and phi_Vn are NaN on those rows and on unsupported shapes)
+    """
+
+    kv: np.ndarray
+    cv: np.ndarray
+    lambda_r: np.ndarray
+    Vn: np.ndarray
+    phi: np.ndarray
+    phi_Vn: np.ndarray
+    supported: np.ndarray
+    tension_field: np.ndarray
+
+
+def shear_batch(
+    d,
+    tw,
+    t,
+    shape,
+    Fy,
+    E,
+    a=None,
+) -> ShearBatch:
+    """
+    Vectorized counterpart of ShearedElement.phi_Vn.
+        - shape: shape designations (only the first letter is used, as in
+          ShearedElement)
+        - a: distance between transverse stiffeners; None or NaN for
+          unstiffened webs
+    """
+    family = np.strings.slice(np.asarray(shape, dtype=np.str_), 0, 1)
+    a = np.nan if a is None else a
+    d, tw, h, family, Fy, E, a = np.broadcast_arrays(
+        np.asarray(d, dtype=np.float64),
+        np.asarray(tw, dtype=np.float64),
+        np.asarray(t, dtype=np.float64),
+        family,
+        np.asarray(Fy, dtype=np.float64),
+        np.asarray(E, dtype=np.float64),
+        np.asarray(a, dtype=np.float64),
+    )
+
+    rolled = np.isin(family, ROLLED_SHAPES)
+    channel = np.isin(family, CHANNEL_SHAPES)
+    supported = rolled | channel
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a_h = a / h
+        tension_field = a_h <= 3
+
+        kv = np.where(tension_field, 5 + 5 / a_h**2, 5.34)
+        lambda_w = h / tw
+        lambda_r = np.where(supported, 1.10 * np.sqrt(kv * E / Fy), np.nan)
+        cv = np.where(lambda_w < lambda_r, 1.0, lambda_r / lambda_w)
+
+        phi = np.select([rolled, channel], [1.0, 0.9], default=np.nan)
+        Vn = np.where(tension_field, np.nan, 0.6 * Fy * d * tw * cv)
+
+    return ShearBatch(
+        kv=kv,
+        cv=cv,
+        lambda_r=lambda_r,
+        Vn=Vn,
+        phi=phi,
+        phi_Vn=Vn * phi,
+        supported=supported,
+        tension_field=tension_field,
+    )
+
+
 if __name__ == "__main__":
     pass
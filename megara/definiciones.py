@@ -1,18 +1,12 @@
-import logging
-from dataclasses import dataclass
-from typing import Optional
-
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s: %(message)s",
-)
+from dataclasses import dataclass, fields
+from typing import Any, Optional
 
 
 @dataclass
 class Steel:
     E: float
     Fy: float
+    Fu: Optional[float] = None
 
 
 @dataclass
@@ -105,11 +99,151 @@ class Section:
     c: Optional[float] = None
 
 
+_SECTION_FIELDS = frozenset(f.name for f in fields(Section))
+
+
+# ----------------
+# Compact sections (one class per family)
+# ----------------
+#
+# Each family stores only the Section fields its catalog table has; the
+# names are checked against Section, so Section stays the single list of
+# fields.
+
+_REQUIRED_FIELDS = ("shape", "a", "j")
+
+_FAMILY_FIELDS: dict[str, tuple[str, ...]] = {
+    "wsmhp": (
+        *_REQUIRED_FIELDS,
+        *("d", "k", "k1", "tw", "bf", "tf", "t", "gage", "wt_ft"),
+        *("bf_2tf", "fy", "d_tw", "rt", "d_af"),
+        *("ix", "sx", "rx", "zx", "iy", "sy", "ry", "zy"),
+        *("cw", "wno", "sw", "qf", "qw"),
+    ),
+    "cmc": (
+        *_REQUIRED_FIELDS,
+        *("d", "k", "tw", "bf", "tf", "t", "gage", "wt_ft", "d_af"),
+        *("ix", "sx", "rx", "zx", "iy", "sy", "ry", "zy"),
+        *("cw", "x_bar", "eo", "ro_bar", "h"),
+    ),
+    "wt": (
+        *_REQUIRED_FIELDS,
+        *("d", "k", "tw", "bf", "tf", "gage", "wt_ft", "y", "qs"),
+        *("ix", "sx", "rx", "zx", "iy", "sy", "ry", "zy"),
+        *("cw", "ro_bar", "h"),
+    ),
+    "angles": (
+        *_REQUIRED_FIELDS,
+        *("k", "t", "wt_ft", "x", "y", "qs"),
+        *("ix", "sx", "rx", "zx", "iy", "sy", "ry", "zy", "rz", "tan_a"),
+        *("cw", "ro_bar", "h"),
+    ),
+    "two_angles": (
+        *_REQUIRED_FIELDS,
+        *("wt_ft", "y", "qs"),
+        *("ix", "sx", "rx", "zx", "ry_0", "ry_3_8", "ry_3_4"),
+        *("ro_bar", "h"),
+    ),
+    "tubes": (
+        *_REQUIRED_FIELDS,
+        *("d", "b", "t", "h", "wt_ft"),
+        *("ix", "sx", "rx", "zx", "iy", "sy", "ry", "zy"),
+    ),
+    "pipes": (
+        *_REQUIRED_FIELDS,
+        *("wt_ft", "o_d", "i_d", "t", "o_d_t", "i", "s", "r", "z", "c"),
+    ),
+}
+
+_unknown = {f for names in _FAMILY_FIELDS.values() for f in names} - _SECTION_FIELDS
+assert not _unknown, f"Family fields missing from Section: {sorted(_unknown)}"
+
+
+class CompactSection:
+    """
+    Base of the slotted, family-specific sections. Each family holds only
+    its own fields (__slots__); any other Section field reads as None, so
+    these can replace Section anywhere.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, shape: str, a: float, j: float, **values: Any):
+        unknown = set(values) - set(self.__slots__)
+        if unknown:
+            raise TypeError(f"{type(self).__name__} has no fields {sorted(unknown)}")
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+        self.shape, self.a, self.j = shape, a, j
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _SECTION_FIELDS:
+            return None
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{n}={getattr(self, n)!r}"
+            for n in self.__slots__
+            if getattr(self, n) is not None
+        )
+        return f"{type(self).__name__}({values})"
+
+
+class RolledSection(CompactSection):
+    """W, S, M and HP shapes."""
+
+    __slots__ = _FAMILY_FIELDS["wsmhp"]
+
+
+class ChannelSection(CompactSection):
+    """C and MC shapes."""
+
+    __slots__ = _FAMILY_FIELDS["cmc"]
+
+
+class TeeSection(CompactSection):
+    """WT shapes."""
+
+    __slots__ = _FAMILY_FIELDS["wt"]
+
+
+class AngleSection(CompactSection):
+    """L shapes."""
+
+    __slots__ = _FAMILY_FIELDS["angles"]
+
+
+class DoubleAngleSection(CompactSection):
+    """2L shapes."""
+
+    __slots__ = _FAMILY_FIELDS["two_angles"]
+
+
+class TubeSection(CompactSection):
+    """HSS shapes."""
+
+    __slots__ = _FAMILY_FIELDS["tubes"]
+
+
+class PipeSection(CompactSection):
+    """Pipe shapes."""
+
+    __slots__ = _FAMILY_FIELDS["pipes"]
+
+
 @dataclass
 class Element:
     name: str
     material: Steel
-    section: Section
+    section: Section | CompactSection
     L: float
     Kx: Optional[float] = None
     Ky: Optional[float] = None
@@ -0,0 +1,257 @@
+from dataclasses import astuple
+from typing import Iterable, Iterator
+
+import numpy as np
+import polars as pl
+
+from .definiciones import Element, Steel
+from .flexión import FlexureBatch, flexure_batch
+from .compresión import CompressionBatch, compression_batch
+from .cortante import ShearBatch, shear_batch
+from .tracción import TensionBatch, tension_batch
+from .secciones import SectionCatalog, SectionTable, catalog as default_catalog
+
+
+# ----------------
+# Columnar members
+# ----------------
+
+_FLEXURE_COLUMNS = ("d", "tf", "tw", "bf", "ry", "sx", "zx", "j", "iy", "cw", "t")
+_COMPRESSION_COLUMNS = ("a", "rx", "ry", "bf", "tf", "tw", "t")
+
+
+class ElementTable:
+    """
+    A project's members stored as columns: one entry per member in each
+    array, with the section and material as indexes into a SectionTable and
+    a tuple of distinct Steel instances.
+        - Lb: unbraced length for flexure (defaults to L)
+        - cb: lateral-torsional buckling modification factor (defaults to 1)
+        - a: distance between transverse stiffeners; NaN for unstiffened webs
+        - Kx, Ky: NaN where the member has none (as None in Element)
+    The batch methods feed flexure_batch, compression_batch and shear_batch
+    directly; element(i) builds the Element the scalar classes expect.
+    Units follow the rest of megara: kip, in, ksi.
+    """
+
+    def __init__(
+        self,
+        sections: SectionTable,
+        materials: Iterable[Steel],
+        name,
+        shape,
+        material,
+        L,
+        Kx=np.nan,
+        Ky=np.nan,
+        Lb=None,
+        cb=1.0,
+        a=np.nan,
+    ):
+        self.sections = sections
+        self.materials: tuple[Steel, ...] = tuple(materials)
+
+        self.name: np.ndarray = np.asarray(name, dtype=object)
+        n = self.name.size
+
+        def column(values, dtype=np.float64) -> np.ndarray:
+            return np.ascontiguousarray(np.broadcast_to(np.asarray(values, dtype), n))
+
+        self.shape: np.ndarray = column(shape, np.intp)
+        self.material: np.ndarray = column(material, np.intp)
+        self.L: np.ndarray = column(L)
+        self.Kx: np.ndarray = column(Kx)
+        self.Ky: np.ndarray = column(Ky)
+        self.Lb: np.ndarray = column(self.L if Lb is None else Lb)
+        self.cb: np.ndarray = column(cb)
+        self.a: np.ndarray = column(a)
+
+        self.E: np.ndarray = np.array([m.E for m in self.materials])[self.material]
+        self.Fy: np.ndarray = np.array([m.Fy for m in self.materials])[self.material]
+        self.Fu: np.ndarray = np.array(
+            [np.nan if m.Fu is None else m.Fu for m in self.materials]
+        )[self.material]
+
+    @classmethod
+    def from_elements(
+        cls,
+        elements: Iterable[Element],
+        Lb=None,
+        cb=1.0,
+        a=np.nan,
+        catalog: SectionCatalog | None = None,
+        family: str = "wsmhp",
+    ) -> "ElementTable":
+        """
+        Columnar copy of existing Elements; equal materials are stored once.
+        Sections are looked up by shape name in the catalog family.
+        """
+        sections = (catalog or default_catalog).section_table(family)
+        materials: dict[tuple, int] = {}
+        names, shapes, material, L, Kx, Ky = [], [], [], [], [], []
+
+        for element in elements:
+            key = astuple(element.material)
+            if key not in materials:
+                materials[key] = len(materials)
+
+            names.append(element.name)
+            shapes.append(sections.index(element.section.shape))
+            material.append(materials[key])
+            L.append(element.L)
+            Kx.append(np.nan if element.Kx is None else element.Kx)
+            Ky.append(np.nan if element.Ky is None else element.Ky)
+
+        return cls(
+            sections,
+            (Steel(*key) for key in materials),
+            names,
+            shapes,
+            material,
+            L,
+            Kx,
+            Ky,
+            Lb,
+            cb,
+            a,
+        )
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pl.DataFrame,
+        materials: Iterable[Steel],
+        catalog: SectionCatalog | None = None,
+        family: str = "wsmhp",
+    ) -> "ElementTable":
+        """
+        Members from a DataFrame with columns name, shape (designation),
+        material (index into materials) and L, plus any of Kx, Ky, Lb, cb
+        and a; missing optional columns take their defaults.
+        """
+        sections = (catalog or default_catalog).section_table(family)
+
+        def optional(column: str, default):
+            if column not in df.columns:
+                return default
+            return df.get_column(column).cast(pl.Float64).fill_null(np.nan).to_numpy()
+
+        return cls(
+            sections,
+            materials,
+            df.get_column("name").to_numpy(),
+            [sections.index(s) for s in df.get_column("shape").to_list()],
+            df.get_column("material").to_numpy(),
+            df.get_column("L").cast(pl.Float64).to_numpy(),
+            Kx=optional("Kx", np.nan),
+            Ky=optional("Ky", np.nan),
+            Lb=optional("Lb", None),
+            cb=optional("cb", 1.0),
+            a=optional("a", np.nan),
+        )
+
+    def __len__(self) -> int:
+        return self.name.size
+
+    # ----------------
+    # Columns
+    # ----------------
+
+    def section_column(self, name: str) -> np.ndarray:
+        """Section property of every member (NaN where missing)."""
+        return self.sections.column(name)[self.shape]
+
+    @property
+    def shapes(self) -> np.ndarray:
+        return self.sections.shapes[self.shape]
+
+    def to_frame(self) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                "name": self.name.tolist(),
+                "shape": self.shapes,
+                "material": self.material,
+                "L": self.L,
+                "Kx": self.Kx,
+                "Ky": self.Ky,
+                "Lb": self.Lb,
+                "cb": self.cb,
+                "a": self.a,
+            }
+        )
+
+    # ----------------
+    # Batch checks
+    # ----------------
+
+    def flexure(self) -> FlexureBatch:
+        return flexure_batch(
+            **{name: self.section_column(name) for name in _FLEXURE_COLUMNS},
+            Lb=self.Lb,
+            cb=self.cb,
+            Fy=self.Fy,
+            E=self.E,
+        )
+
+    def compression(self) -> CompressionBatch:
+        return compression_batch(
+            **{name: self.section_column(name) for name in _COMPRESSION_COLUMNS},
+            L=self.L,
+            Kx=self.Kx,
+            Ky=self.Ky,
+            Fy=self.Fy,
+            E=self.E,
+        )
+
+    def shear(self) -> ShearBatch:
+        return shear_batch(
+            self.section_column("d"),
+            self.section_column("tw"),
+            self.section_column("t"),
+            self.shapes,
+            self.Fy,
+            self.E,
+            a=self.a,
+        )
+
+    def tension(self, An=None, U=1.0) -> TensionBatch:
+        """
+        Tensile strength of every member; An (net area, defaults to the
+        gross area) and U (shear lag factor) may be scalars or per-member.
+        """
+        r = np.fmin(
+            np.fmin(self.section_column("rx"), self.section_column("ry")),
+            self.section_column("rz"),
+        )
+        return tension_batch(
+            self.section_column("a"), r, self.L, self.Fy, self.Fu, An=An, U=U
+        )
+
+    # ----------------
+    # Scalar API
+    # ----------------
+
+    def element(self, i: int) -> Element:
+        """
+        Element for member i, for FlexedElement, CompressedElement and
+        ShearedElement. The section is a row view of the SectionTable and
+        the material is shared with every member that uses it.
+        """
+        return Element(
+            name=self.name[i],
+            material=self.materials[self.material[i]],
+            section=self.sections[int(self.shape[i])],
+            L=float(self.L[i]),
+            Kx=None if np.isnan(self.Kx[i]) else float(self.Kx[i]),
+            Ky=None if np.isnan(self.Ky[i]) else float(self.Ky[i]),
+        )
+
+    def __getitem__(self, i: int) -> Element:
+        return self.element(i)
+
+    def __iter__(self) -> Iterator[Element]:
+        return (self.element(i) for i in range(len(self)))
+
+
+if __name__ == "__main__":
+    pass
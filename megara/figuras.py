@@ -0,0 +1,313 @@
+import os
+import multiprocessing
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from etc.paths import local_paths
+from .flexión import FlexedElement
+from .compresión import CompressedElement
+from .cortante import ShearedElement
+from .traza import set_quiet
+
+
+# ----------------
+# Templates
+# ----------------
+#
+# Each template builds its figure once, with the same styling as the
+# element's own _*_figure, on a plain (non-pyplot) Agg figure. Rendering an
+# element only updates line data, markers, annotations and the title.
+
+_ANNOTATION = dict(textcoords="offset points", xytext=(5, 5), fontsize=9)
+_CALLOUT = dict(
+    textcoords="offset points",
+    arrowprops=dict(arrowstyle="->", linewidth=1.5, relpos=(1, 1)),
+    bbox=dict(boxstyle="round,pad=0.3", fc="white", alpha=0.5),
+    fontsize=9,
+    ha="left",
+    va="bottom",
+)
+
+
+def _new_figure():
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+class _FlexureTemplate:
+    suffix = "flexure"
+
+    def __init__(self):
+        self.fig, ax = _new_figure()
+        self.Lb_max = 30
+
+        self.plastic = ax.axvspan(0, 1, alpha=0.08, color="black", label="Plastic")
+        self.inelastic = ax.axvspan(0, 1, alpha=0.15, color="black", label="Inelastic")
+        self.elastic = ax.axvspan(0, 1, alpha=0.20, color="black", label="Elastic")
+
+        (self.curve,) = ax.plot([], [], color="black", linewidth=2, label="_nolegend_")
+        self.Lp_line = ax.axvline(
+            0, linestyle="--", color="tab:red", label="_nolegend_"
+        )
+        self.Lr_line = ax.axvline(
+            0, linestyle="--", color="tab:blue", label="_nolegend_"
+        )
+
+        self.Mp_point = ax.scatter([0], [0], zorder=5, color="red")
+        self.Mp_text = ax.annotate("", xy=(0, 0), **_ANNOTATION)
+        self.Lp_text = ax.annotate("", xy=(0, 0), **_ANNOTATION)
+        self.Mr_point = ax.scatter([0], [0], zorder=5, color="blue")
+        self.Mr_text = ax.annotate("", xy=(0, 0), **_ANNOTATION)
+        self.Lr_text = ax.annotate("", xy=(0, 0), **_ANNOTATION)
+        self.Mn_point = ax.scatter([0], [0], zorder=6, color="black")
+        self.Mn_text = ax.annotate("", xy=(0, 0), xytext=(-60, -45), **_CALLOUT)
+
+        ax.set_xlim(0, 30)
+        ax.set_ylim(0, 80)
+        ax.set_xlabel("Unbraced Length, $Lb$ $($ft)$")
+        ax.set_ylabel(r"Available Moment, $\phi M_n$ $(kip-ft)$")
+        ax.grid(True)
+        ax.legend()
+
+        self.title = self.fig.suptitle("")
+
+    def update(self, element: FlexedElement) -> None:
+        Lp, Lr, Lb = element.Lp / 12, element.Lr / 12, element.Lb / 12
+        phi_Mp = 0.9 * element.Mp / 12
+        phi_Mr = 0.9 * element.Mr / 12
+        phi_Mn = 0.9 * element.Mn / 12
+
+        for span, x0, x1 in (
+            (self.plastic, 0, Lp),
+            (self.inelastic, Lp, Lr),
+            (self.elastic, Lr, self.Lb_max),
+        ):
+            span.set_x(x0)
+            span.set_width(x1 - x0)
+
+        self.curve.set_data(*element._Mn_curve)
+        self.Lp_line.set_xdata([Lp, Lp])
+        self.Lr_line.set_xdata([Lr, Lr])
+
+        self.Mp_point.set_offsets([[Lp, phi_Mp]])
+        self.Mp_text.xy = (Lp, phi_Mp)
+        self.Mp_text.set_text(f"ɸMp: {phi_Mp:.2f}")
+        self.Lp_text.xy = (Lp, 0)
+        self.Lp_text.set_text(f"Lp: {Lp:.3f}")
+
+        self.Mr_point.set_offsets([[Lr, phi_Mr]])
+        self.Mr_text.xy = (Lr, phi_Mr)
+        self.Mr_text.set_text(f"ɸMr: {phi_Mr:.2f}")
+        self.Lr_text.xy = (Lr, 0)
+        self.Lr_text.set_text(f"Lr: {Lr:.3f}")
+
+        self.Mn_point.set_offsets([[Lb, phi_Mn]])
+        self.Mn_text.xy = (Lb, phi_Mn)
+        self.Mn_text.set_text(f"Lb   : {Lb:.3f}\nɸMn: {phi_Mn:.2f}")
+
+        self.title.set_text(
+            r"Plot of Available Moment ($\phi M_n$) vs"
+            "\n"
+            rf"Unbraced Length ($L_b$) for {element.element.name} ({element.shape})"
+        )
+
+
+class _CompressionTemplate:
+    suffix = "compression"
+
+    def __init__(self):
+        self.fig, self.ax = _new_figure()
+        ax = self.ax
+
+        (self.curve,) = ax.plot([], [], color="black", linewidth=2, label="_nolegend_")
+        self.x_line = ax.axvline(0, linestyle="--", color="tab:red", label="_nolegend_")
+        self.y_line = ax.axvline(
+            0, linestyle="--", color="tab:blue", label="_nolegend_"
+        )
+
+        self.x_point = ax.scatter([0], [0], zorder=5, color="tab:red")
+        self.y_point = ax.scatter([0], [0], zorder=5, color="tab:blue")
+        self.x_slenderness_text = ax.annotate("", xy=(0, 0), **_ANNOTATION)
+        self.x_text = ax.annotate("", xy=(0, 0), **_ANNOTATION)
+        self.y_slenderness_text = ax.annotate("", xy=(0, 0), **_ANNOTATION)
+        self.y_text = ax.annotate("", xy=(0, 0), **_ANNOTATION)
+        self.gov_point = ax.scatter([0], [0], zorder=6, color="black")
+        self.gov_text = ax.annotate("", xy=(0, 0), xytext=(-75, -45), **_CALLOUT)
+
+        ax.set_xlim(0, 200)
+        ax.set_xlabel("Slenderness, KL/r")
+        ax.set_ylabel("Design Force, ɸPn (kip)")
+        ax.grid(True)
+
+        self.title = self.fig.suptitle("")
+
+    def update(self, element: CompressedElement) -> None:
+        sx, sy = element.slenderness_x, element.slenderness_y
+        phi_A = element.A * element.phi
+        phi_Pn_x = phi_A * element.critical_buckling_stress(sx)
+        phi_Pn_y = phi_A * element.critical_buckling_stress(sy)
+        s_gov = sx if phi_Pn_x <= phi_Pn_y else sy
+        phi_Pn_gov = min(phi_Pn_x, phi_Pn_y)
+
+        self.curve.set_data(*element._phi_Pn_curve)
+        self.x_line.set_xdata([sx, sx])
+        self.y_line.set_xdata([sy, sy])
+
+        self.x_point.set_offsets([[sx, phi_Pn_x]])
+        self.y_point.set_offsets([[sy, phi_Pn_y]])
+        self.x_slenderness_text.xy = (sx, 0)
+        self.x_slenderness_text.set_text(f"KL/rx: {sx:.2f}")
+        self.x_text.xy = (sx, phi_Pn_x)
+        self.x_text.set_text(f"ɸFcr_x * A: {phi_Pn_x:.2f}")
+        self.y_slenderness_text.xy = (sy, 0)
+        self.y_slenderness_text.set_text(f"KL/ry: {sy:.2f}")
+        self.y_text.xy = (sy, phi_Pn_y)
+        self.y_text.set_text(f"ɸFcr_y * A: {phi_Pn_y:.2f}")
+
+        self.gov_point.set_offsets([[s_gov, phi_Pn_gov]])
+        self.gov_text.xy = (s_gov, phi_Pn_gov)
+        self.gov_text.set_text(f"ɸPn:  {phi_Pn_gov:.3f}\nKL/r: {s_gov:.2f}")
+
+        self.ax.relim()
+        self.ax.autoscale_view(scalex=False)
+        self.ax.set_ylim(bottom=0)
+
+        self.title.set_text(
+            "Compression Buckling Curve: Available Force (ɸPn)\n"
+            "vs Column Slenderness (KL/r) for "
+            f"{element.element.name} ({element.element.section.shape})"
+        )
+
+
+class _ShearTemplate:
+    suffix = "shear"
+
+    def __init__(self):
+        self.fig, ax = _new_figure()
+
+        (self.curve,) = ax.plot([], [], color="black", linewidth=2, label="_nolegend_")
+        self.lambda_r_line = ax.axvline(
+            0, linestyle="--", color="tab:red", label="_nolegend_"
+        )
+        self.point = ax.scatter([0], [0], zorder=5, color="black")
+        self.lambda_r_text = ax.annotate("", xy=(0, 0), **_ANNOTATION)
+        self.Vn_text = ax.annotate(
+            "",
+            xy=(0, 0),
+            textcoords="offset points",
+            xytext=(40, 60),
+            arrowprops=dict(arrowstyle="->", linewidth=1.5),
+            bbox=dict(boxstyle="round,pad=0.3", fc="white", alpha=0.5),
+            fontsize=9,
+            ha="left",
+            va="center",
+        )
+
+        ax.set_xlim(0, 250)
+        ax.set_ylim(0, 80)
+        ax.set_xlabel(r"Web slenderness, $\lambda_w$ $(h/t_w)$")
+        ax.set_ylabel(r"Nominal Shear Strength, $\phi V_n$ $(kip)$")
+        ax.grid(True)
+
+        self.title = self.fig.suptitle("")
+
+    def update(self, element: ShearedElement) -> None:
+        lambda_r = element._lambda_r
+        lambda_w = element._lambda_w
+        Vn_w = element.phi * 0.6 * element.Fy * element.Aw * element.cv
+
+        self.curve.set_data(*element._phi_Vn_curve)
+        self.lambda_r_line.set_xdata([lambda_r, lambda_r])
+        self.point.set_offsets([[lambda_w, Vn_w]])
+        self.lambda_r_text.xy = (lambda_r, 0)
+        self.lambda_r_text.set_text(f"$\\lambda_r = {lambda_r:.2f}$")
+        self.Vn_text.xy = (lambda_w, Vn_w)
+        self.Vn_text.set_text(f"$V_n$:  {Vn_w:.3f}\n$\\lambda_w$: {lambda_w:.2f}")
+
+        self.title.set_text(
+            r"Plot of Available Shear Strength ($\phi V_n$) vs"
+            "\n"
+            rf"Web Slenderness ($\lambda_w$) for {element.element.name} "
+            f"({element.element.section.shape})"
+        )
+
+
+_TEMPLATE_TYPES = {
+    FlexedElement: _FlexureTemplate,
+    CompressedElement: _CompressionTemplate,
+    ShearedElement: _ShearTemplate,
+}
+
+# One set of templates per worker process
+_templates: dict[type, object] = {}
+
+
+def _render(
+    element: FlexedElement | CompressedElement | ShearedElement,
+    directory: Path,
+    dpi: int,
+) -> Path:
+    kind = type(element)
+    if kind not in _templates:
+        _templates[kind] = _TEMPLATE_TYPES[kind]()
+    template = _templates[kind]
+
+    template.update(element)
+    path = directory / f"{element.element.name}_{template.suffix}.png"
+    template.fig.savefig(path, dpi=dpi, bbox_inches="tight")
+    return path
+
+
+# ----------------
+# Batch export
+# ----------------
+
+
+def save_curves(
+    elements: Iterable[FlexedElement | CompressedElement | ShearedElement],
+    directory: Path = local_paths.cache,
+    dpi: int = 300,
+    workers: int | None = None,
+    max_pending: int | None = None,
+) -> Iterator[Path]:
+    """
+    Render the design curve of every element to PNG in a process pool,
+    yielding each path as soon as its file is written (not necessarily in
+    input order). File names match save_Mn_curve, save_phi_Pn_curve and
+    save_Vn_curve. At most max_pending elements are in flight, so memory
+    stays bounded for any number of elements.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+
+    # Spawned, not forked: the parent has matplotlib loaded and may hold
+    # logging or thread locks a forked child would inherit
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=set_quiet,
+    ) as pool:
+        pending: set[Future] = set()
+
+        for element in elements:
+            if type(element) not in _TEMPLATE_TYPES:
+                raise TypeError(f"No design curve for {type(element).__name__}")
+
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+
+            pending.add(pool.submit(_render, element, directory, dpi))
+
+        yield from (future.result() for future in as_completed(pending))
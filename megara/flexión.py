@@ -1,12 +1,12 @@
 import logging
-from enum import Enum
+from enum import Enum, IntEnum
 from dataclasses import dataclass
 from functools import cached_property
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from .definiciones import Element
+from .traza import Traced
 from etc.paths import local_paths
 
 
@@ -23,8 +23,25 @@ class Slenderness(Enum):
     noncompact = "noncompact"
 
 
+# Integer codes used by the batch engine, in the same order as the
+# branches of FlexedElement.slenderness
+SLENDERNESS_CODES: tuple[Slenderness, ...] = (
+    Slenderness.compact,
+    Slenderness.noncompact,
+    Slenderness.slender,
+)
+
+
+class FlexureRegime(IntEnum):
+    plastic = 0
+    inelastic = 1
+    elastic = 2
+    noncompact = 3
+    slender = 4
+
+
 @dataclass(frozen=True)
-class FlexedElement:
+class FlexedElement(Traced):
     element: Element
     Lb: float
     cb: float
@@ -34,10 +51,9 @@ class FlexedElement:
     # ----------------
 
     def __post_init__(self):
-        logger.info(
-            f"\n\n:: Applying flexure to element {self.element.name}...\n"
-            + "-" * 45
-            + "\n"
+        self._info(
+            "\n\n:: Applying flexure to element %s...\n" + "-" * 45 + "\n",
+            self.element.name,
         )
 
     @cached_property
@@ -47,7 +63,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "shape" for element {self.element.section.shape}.'
             )
-        logger.info(f"shape : {self.element.section.shape}")
+        self._record("shape", self.element.section.shape)
         return self.element.section.shape
 
     @cached_property
@@ -57,7 +73,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "d" for element {self.element.section.shape}.'
             )
-        logger.info(f"d : {self.element.section.d}")
+        self._record("d", self.element.section.d)
         return self.element.section.d
 
     @cached_property
@@ -67,7 +83,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "h = t" for element {self.element.section.shape}.'
             )
-        logger.info(f"d : {self.element.section.t}")
+        self._record("h", self.element.section.t)
         return self.element.section.t
 
     @cached_property
@@ -77,7 +93,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "tf" for element {self.element.section.shape}.'
             )
-        logger.info(f"tf : {self.element.section.tf}")
+        self._record("tf", self.element.section.tf)
         return self.element.section.tf
 
     @cached_property
@@ -87,7 +103,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "tw" for element {self.element.section.shape}.'
             )
-        logger.info(f"tw : {self.element.section.tw}")
+        self._record("tw", self.element.section.tw)
         return self.element.section.tw
 
     @cached_property
@@ -97,7 +113,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "bf" for element {self.element.section.shape}.'
             )
-        logger.info(f"bf : {self.element.section.bf}")
+        self._record("bf", self.element.section.bf)
         return self.element.section.bf
 
     @cached_property
@@ -107,7 +123,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "ry" for element {self.element.section.shape}.'
             )
-        logger.info(f"ry : {self.element.section.ry}")
+        self._record("ry", self.element.section.ry)
         return self.element.section.ry
 
     @cached_property
@@ -117,7 +133,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "sx" for element {self.element.section.shape}.'
             )
-        logger.info(f"sx : {self.element.section.sx}")
+        self._record("sx", self.element.section.sx)
         return self.element.section.sx
 
     @cached_property
@@ -127,7 +143,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "j" for element {self.element.section.shape}.'
             )
-        logger.info(f"j : {self.element.section.j}")
+        self._record("j", self.element.section.j)
         return self.element.section.j
 
     @cached_property
@@ -137,7 +153,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "ix" for element {self.element.section.shape}.'
             )
-        logger.info(f"ix : {self.element.section.ix}")
+        self._record("ix", self.element.section.ix)
         return self.element.section.ix
 
     @cached_property
@@ -147,7 +163,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "iy" for element {self.element.section.shape}.'
             )
-        logger.info(f"iy : {self.element.section.iy}")
+        self._record("iy", self.element.section.iy)
         return self.element.section.iy
 
     @cached_property
@@ -157,7 +173,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "cw" for element {self.element.section.shape}.'
             )
-        logger.info(f"cw : {self.element.section.cw}")
+        self._record("cw", self.element.section.cw)
         return self.element.section.cw
 
     @cached_property
@@ -167,19 +183,19 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "zx" for element {self.element.section.shape}.'
             )
-        logger.info(f"zx : {self.element.section.zx}")
+        self._record("zx", self.element.section.zx)
         return self.element.section.zx
 
     @cached_property
     def rts(self) -> float:
         value = np.sqrt(np.sqrt(self.iy * self.cw) / self.sx)
-        logger.info(f"rts : {value}")
+        self._record("rts", value)
         return value
 
     @cached_property
     def ho(self) -> float:
         value = self.d - self.tf
-        logger.info(f"ho : {value}")
+        self._record("ho", value)
         return value
 
     # ----------------
@@ -193,7 +209,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "E" for element {self.element.section.shape}.'
             )
-        logger.info(f"E : {self.element.material.E}")
+        self._record("E", self.element.material.E)
         return self.element.material.E
 
     @cached_property
@@ -203,7 +219,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "Fy" for element {self.element.section.shape}.'
             )
-        logger.info(f"Fy : {self.element.material.Fy}")
+        self._record("Fy", self.element.material.Fy)
         return self.element.material.Fy
 
     @cached_property
@@ -213,7 +229,7 @@ class FlexedElement:
             raise FlexureValueNeeded(
                 f'Missing parameter "L" for element {self.element.section.shape}.'
             )
-        logger.info(f"L : {self.element.L}")
+        self._record("L", self.element.L)
         return self.element.L
 
     # ----------------
@@ -223,49 +239,49 @@ class FlexedElement:
     @cached_property
     def _lambda_w(self) -> float:
         _lambda = self.h / self.tw
-        logger.info(f"λ_w : {_lambda}")
+        self._record("λ_w", _lambda)
         return _lambda
 
     @cached_property
     def lambda_pw(self) -> float:
         lambda_pw = 3.76 * np.sqrt(self.E / self.Fy)
-        logger.info(f"λ_pf : {lambda_pw}")
+        self._record("λ_pw", lambda_pw)
         return lambda_pw
 
     @cached_property
     def lambda_rw(self) -> float:
         lambda_rw = 5.70 * np.sqrt(self.E / self.Fy)
-        logger.info(f"λ_rf : {lambda_rw}")
+        self._record("λ_rw", lambda_rw)
         return lambda_rw
 
     @cached_property
     def _lambda_f(self) -> float:
         _lambda = self.bf / (2 * self.tf)
-        logger.info(f"λ_f : {_lambda}")
+        self._record("λ_f", _lambda)
         return _lambda
 
     @cached_property
     def lambda_pf(self) -> float:
         lambda_pf = 0.38 * np.sqrt(self.E / self.Fy)
-        logger.info(f"λ_pf : {lambda_pf}")
+        self._record("λ_pf", lambda_pf)
         return lambda_pf
 
     @cached_property
     def lambda_rf(self) -> float:
         lambda_rf = np.sqrt(self.E / self.Fy)
-        logger.info(f"λ_rf : {lambda_rf}")
+        self._record("λ_rf", lambda_rf)
         return lambda_rf
 
     @cached_property
     def slenderness(self) -> Slenderness:
         if self._lambda_f <= self.lambda_pf and self._lambda_w <= self.lambda_pw:
-            logger.info("slenderness : compact")
+            self._record("slenderness", Slenderness.compact)
             return Slenderness.compact
         elif self._lambda_f <= self.lambda_rf and self._lambda_w <= self.lambda_rw:
-            logger.info("slenderness : non-compact")
+            self._record("slenderness", Slenderness.noncompact)
             return Slenderness.noncompact
         else:
-            logger.info("slenderness : slender")
+            self._record("slenderness", Slenderness.slender)
             return Slenderness.slender
 
     # if compact, design by flexure
@@ -281,7 +297,7 @@ class FlexedElement:
     @cached_property
     def kc(self) -> float:
         value = 4 / np.sqrt(self.h / self.tw)
-        logger.info(f"kc : {value}")
+        self._record("kc", value)
         return value
 
     @cached_property
@@ -296,7 +312,7 @@ class FlexedElement:
     @cached_property
     def Lp(self) -> float:
         value = 1.76 * self.ry * np.sqrt(self.E / self.Fy)
-        logger.info(f"Lp : {value}")
+        self._record("Lp", value)
         return value
 
     @cached_property
@@ -308,7 +324,7 @@ class FlexedElement:
             #     return 1
             # elif self.shape[0] == "C":
             value = (self.ho / 2) * np.sqrt(self.iy / self.cw)
-            logger.info(f"c[Section C] : {value}")
+            self._record("c[Section C]", value)
             return value
         else:
             logger.error("Invalid section shape for c")
@@ -326,17 +342,17 @@ class FlexedElement:
             )
         )
         value = 1.95 * self.rts * self.E / (0.7 * self.Fy) * term1 * term2
-        logger.info(f"Lr : {value}")
+        self._record("Lr", value)
         return value
 
     @cached_property
     def Mp(self) -> float:
         value = self.Fy * self.zx
-        logger.info(f"Mp : {value}")
+        self._record("Mp", value)
         return value
 
     def plastic_Mn(self, Lb: float) -> float:
-        logger.debug(f"plastic_Mn(Lb={Lb}) : {self.Mp}")
+        self._debug("plastic_Mn(Lb=%s) : %s", Lb, self.Mp)
         return self.Mp
 
     def inelastic_Mn(self, Lb) -> float:
@@ -346,7 +362,7 @@ class FlexedElement:
             * ((Lb - self.Lp) / (self.Lr - self.Lp))
         )
 
-        logger.debug(f"inelastic_Mn(Lb={Lb}) : {value}")
+        self._debug("inelastic_Mn(Lb=%s) : %s", Lb, value)
         return value
 
     def elastic_Mn(self, Lb: float) -> float:
@@ -362,13 +378,13 @@ class FlexedElement:
             )
             * self.sx
         )
-        logger.debug(f"elastic_Mn(Lb={Lb}) : {value}")
+        self._debug("elastic_Mn(Lb=%s) : %s", Lb, value)
         return value
 
     @cached_property
     def Mr(self) -> float:
         value = self.inelastic_Mn(self.Lr)
-        logger.info(f"Mr : {value}")
+        self._record("Mr", value)
         return value
 
     @cached_property
@@ -390,7 +406,7 @@ class FlexedElement:
     def phi_Mn(self) -> float:
         phi = 0.90
         value = self.Mn * phi
-        logger.info(f"ɸMn : {value}")
+        self._record("ɸMn", value)
         return value
 
     # ----------------
@@ -401,35 +417,37 @@ class FlexedElement:
 
     @cached_property
     def live_deflection_limit(self) -> float:
-        logger.info(f"Deflection limit for live load: {self.L / 360}")
+        self._record("Deflection limit for live load", self.L / 360)
         return self.L / 360
 
     @cached_property
     def dead_live_deflection_limit(self) -> float:
-        logger.info(f"Deflection limit for dead + live load: {self.L / 240}")
+        self._record("Deflection limit for dead + live load", self.L / 240)
         return self.L / 240
 
     def deflection_test(self, dead: float, live: float) -> bool:
         live_deflection = self.max_deflection(live)
-        logger.info(f"Deflection for live load: {live_deflection}")
-        logger.info(
-            f"Deflection R for live load: {live_deflection / self.live_deflection_limit}"
+        self._record("Deflection for live load", live_deflection)
+        self._record(
+            "Deflection R for live load",
+            live_deflection / self.live_deflection_limit,
         )
 
         dead_live_deflection = self.max_deflection(dead + live)
-        logger.info(f"Deflection for dead + live load: {dead_live_deflection}")
-        logger.info(
-            f"Deflection R for dead + live load: {dead_live_deflection / self.dead_live_deflection_limit}"
+        self._record("Deflection for dead + live load", dead_live_deflection)
+        self._record(
+            "Deflection R for dead + live load",
+            dead_live_deflection / self.dead_live_deflection_limit,
         )
 
         if (
             live_deflection < self.live_deflection_limit
             and dead_live_deflection < self.dead_live_deflection_limit
         ):
-            logger.info(">> Deflection test passed.")
+            self._info(">> Deflection test passed.")
             return True
         else:
-            logger.info(">> Deflection test failed.")
+            self._info(">> Deflection test failed.")
             return False
 
     # ----------------
@@ -437,19 +455,26 @@ class FlexedElement:
     # ----------------
 
     @cached_property
-    def _Mn_figure(self):
+    def _Mn_curve(self) -> tuple[np.ndarray, np.ndarray]:
+        # Lb in ft, ɸMn in kip-ft
         Lb_max = 30
         n = 360
         Lb_vals = np.linspace(0.01, Lb_max, n)
-        Mn_vals = np.zeros_like(Lb_vals)
+        Lb = Lb_vals * 12
 
-        for i, Lb in enumerate(Lb_vals):
-            if Lb * 12 <= self.Lp:
-                Mn_vals[i] = 0.9 * self.Mp / 12
-            elif Lb * 12 <= self.Lr:
-                Mn_vals[i] = 0.9 * self.inelastic_Mn(Lb * 12) / 12
-            else:
-                Mn_vals[i] = 0.9 * self.elastic_Mn(Lb * 12) / 12
+        Mn_vals = np.select(
+            [Lb <= self.Lp, Lb <= self.Lr],
+            [np.full_like(Lb, self.Mp), self.inelastic_Mn(Lb)],
+            default=self.elastic_Mn(Lb),
+        )
+        return Lb_vals, 0.9 * Mn_vals / 12
+
+    @cached_property
+    def _Mn_figure(self):
+        import matplotlib.pyplot as plt
+
+        Lb_max = 30
+        Lb_vals, Mn_vals = self._Mn_curve
 
         fig, ax = plt.subplots()
 
@@ -546,6 +571,8 @@ class FlexedElement:
         return fig, ax
 
     def show_Mn_curve(self):
+        import matplotlib.pyplot as plt
+
         _, _ = self._Mn_figure
         plt.show()
 
@@ -553,11 +580,155 @@ class FlexedElement:
         self,
         dpi: int = 300,
     ):
+        import matplotlib.pyplot as plt
+
         fig, _ = self._Mn_figure
         path = local_paths.cache / f"{self.element.name}_flexure.png"
         fig.savefig(path, dpi=dpi, bbox_inches="tight")
         plt.close(fig)
 
 
+# ----------------
+# Batch
+# ----------------
+
+
+@dataclass(frozen=True)
+class FlexureBatch:
+    """
+    Columnar result of flexure_batch; every field is an array with the
+    broadcast shape of the inputs.
+        - slenderness: codes into SLENDERNESS_CODES
+        - regime: FlexureRegime codes of the governing Mn branch
+    """
+
+    Lp: np.ndarray
+    Lr: np.ndarray
+    Mp: np.ndarray
+    Mr: np.ndarray
+    Mn: np.ndarray
+    phi_Mn: np.ndarray
+    slenderness: np.ndarray
+    regime: np.ndarray
+
+
+def flexure_batch(
+    d,
+    tf,
+    tw,
+    bf,
+    ry,
+    sx,
+    zx,
+    j,
+    iy,
+    cw,
+    t,
+    Lb,
+    cb,
+    Fy,
+    E,
+) -> FlexureBatch:
+    """
+    Vectorized counterpart of FlexedElement.phi_Mn for W shapes.
+    Inputs broadcast against each other, so a catalog can be screened
+    against a grid of unbraced lengths with sections[:, None] and Lb[None, :].
+    Branches follow FlexedElement.Mn exactly; missing data propagates as NaN
+    instead of raising FlexureValueNeeded.
+    """
+    d, tf, tw, bf, ry, sx, zx, j, iy, cw, h, Lb, cb, Fy, E = (
+        np.asarray(x, dtype=np.float64)
+        for x in np.broadcast_arrays(
+            d, tf, tw, bf, ry, sx, zx, j, iy, cw, t, Lb, cb, Fy, E
+        )
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # ---- Section
+        rts = np.sqrt(np.sqrt(iy * cw) / sx)
+        ho = d - tf
+        c = (ho / 2) * np.sqrt(iy / cw)
+
+        # ---- Slenderness
+        lambda_w = h / tw
+        lambda_f = bf / (2 * tf)
+        root = np.sqrt(E / Fy)
+        lambda_pw = 3.76 * root
+        lambda_rw = 5.70 * root
+        lambda_pf = 0.38 * root
+        lambda_rf = root
+
+        compact = (lambda_f <= lambda_pf) & (lambda_w <= lambda_pw)
+        noncompact = ~compact & (lambda_f <= lambda_rf) & (lambda_w <= lambda_rw)
+        slender = ~compact & ~noncompact
+
+        slenderness = np.full(d.shape, 2, dtype=np.int8)
+        slenderness[noncompact] = 1
+        slenderness[compact] = 0
+
+        # ---- Lateral-torsional buckling
+        Lp = 1.76 * ry * root
+        jc = j * c / (sx * ho)
+        Lr = (
+            1.95
+            * rts
+            * E
+            / (0.7 * Fy)
+            * np.sqrt(jc)
+            * np.sqrt(1 + np.sqrt(1 + 6.76 * (0.7 * Fy * sx * ho / (E * j * c)) ** 2))
+        )
+        Mp = Fy * zx
+
+        def inelastic(L):
+            return cb * (Mp - (Mp - 0.7 * Fy * sx) * ((L - Lp) / (Lr - Lp)))
+
+        Mr = inelastic(Lr)
+        elastic = (
+            ((cb * np.pi**2 * E) / (Lb / rts) ** 2)
+            * np.sqrt(1 + 0.078 * jc * (Lb / rts) ** 2)
+            * sx
+        )
+
+        # ---- Local buckling
+        _lambda = np.maximum(lambda_w, lambda_f)
+        noncompact_Mn = Mp - (Mp - 0.7 * Fy * sx) * (_lambda - lambda_pf) / (
+            lambda_rf - lambda_pf
+        )
+        kc = 4 / np.sqrt(h / tw)
+        slender_Mn = 0.9 * E * kc * sx / (_lambda**2)
+
+        plastic = compact & (Lb <= Lp)
+        inelastic_range = compact & ~plastic & (Lb <= Lr)
+        elastic_range = compact & ~plastic & ~inelastic_range
+
+        Mn = np.select(
+            [plastic, inelastic_range, elastic_range, noncompact, slender],
+            [Mp, inelastic(Lb), np.minimum(elastic, Mp), noncompact_Mn, slender_Mn],
+            default=np.nan,
+        )
+
+    regime = np.select(
+        [plastic, inelastic_range, elastic_range, noncompact],
+        [
+            FlexureRegime.plastic,
+            FlexureRegime.inelastic,
+            FlexureRegime.elastic,
+            FlexureRegime.noncompact,
+        ],
+        default=FlexureRegime.slender,
+    ).astype(np.int8)
+
+    return FlexureBatch(
+        Lp=Lp,
+        Lr=Lr,
+        Mp=Mp,
+        Mr=Mr,
+        Mn=Mn,
+        phi_Mn=0.90 * Mn,
+        slenderness=slenderness,
+        regime=regime,
+    )
+
+
 if __name__ == "__main__":
     pass
@@ -1,6 +1,80 @@
+import numpy as np
+
+
 def moment_beam(W: float, L: float):
     """
     Momento por metro lineal en una viga simplemente apoyada:
         - W: Peso distribuido (force/length)
         - L: Largo de la viga"""
     return W * L**2 / 8
+
+
+# ----------------
+# Cb (AISC F1-1)
+# ----------------
+
+
+def cb_batch(M) -> np.ndarray:
+    """
+    Cb de varios segmentos no arriostrados a la vez (AISC F1-1):
+        - M: momentos muestreados a intervalos iguales a lo largo de cada
+          segmento, incluidos los extremos (n_segmentos × n_muestras)
+    MA, MB y MC se interpolan en los cuartos del segmento; Mmax es el
+    máximo valor absoluto muestreado. Un segmento sin momento tiene Cb = 1."""
+    M = np.abs(np.atleast_2d(np.asarray(M, dtype=np.float64)))
+    n = M.shape[1]
+    if n < 2:
+        raise ValueError("Se necesitan al menos 2 muestras por segmento")
+
+    # Posición de los cuartos en índices de muestra
+    quarters = np.array([0.25, 0.50, 0.75]) * (n - 1)
+    i = np.minimum(np.floor(quarters).astype(np.intp), n - 2)
+    w = quarters - i
+    MA, MB, MC = (M[:, i] * (1 - w) + M[:, i + 1] * w).T
+
+    M_max = M.max(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cb = 12.5 * M_max / (2.5 * M_max + 3 * MA + 4 * MB + 3 * MC)
+    return np.where(M_max == 0, 1.0, cb)
+
+
+def split_at_braces(x, M, braces, samples: int = 21) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Divide diagramas de momento en sus segmentos no arriostrados y los
+    remuestrea a intervalos iguales:
+        - x: estaciones del diagrama, crecientes (n_estaciones,)
+        - M: momentos en las estaciones (n_elementos × n_estaciones), o
+          (n_estaciones,) para un solo elemento
+        - braces: posiciones de los arriostres entre x[0] y x[-1]
+    Devuelve Lb (n_segmentos,) y los momentos remuestreados
+    (n_elementos × n_segmentos × samples), con el mismo arriostramiento para
+    todos los elementos."""
+    x = np.asarray(x, dtype=np.float64)
+    M = np.atleast_2d(np.asarray(M, dtype=np.float64))
+    if M.shape[1] != x.size:
+        raise ValueError(f"M tiene {M.shape[1]} estaciones y x tiene {x.size}")
+
+    inner = np.asarray(braces, dtype=np.float64).ravel()
+    inner = np.unique(inner[(inner > x[0]) & (inner < x[-1])])
+    ends = np.concatenate(([x[0]], inner, [x[-1]]))
+    Lb = np.diff(ends)
+
+    # Estaciones de cada segmento y pesos de interpolación lineal, comunes a
+    # todos los elementos
+    t = np.linspace(0.0, 1.0, samples)
+    xs = (ends[:-1, None] + Lb[:, None] * t).ravel()
+    j = np.clip(np.searchsorted(x, xs, side="right") - 1, 0, x.size - 2)
+    w = (xs - x[j]) / (x[j + 1] - x[j])
+
+    resampled = M[:, j] * (1 - w) + M[:, j + 1] * w
+    return Lb, resampled.reshape(M.shape[0], Lb.size, samples)
+
+
+def cb_from_diagram(x, M, braces, samples: int = 21) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Lb y Cb de cada segmento no arriostrado de uno o varios elementos:
+        - x, M, braces: como en split_at_braces
+    Devuelve Lb (n_segmentos,) y Cb (n_elementos × n_segmentos)."""
+    Lb, segments = split_at_braces(x, M, braces, samples)
+    n, k, _ = segments.shape
+    return Lb, cb_batch(segments.reshape(n * k, samples)).reshape(n, k)
@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .combinaciones import combination_matrix
+
+
+# ----------------
+# AISC H1: combined axial force and flexure
+# ----------------
+#
+# Sign convention: Pu > 0 is compression, Pu < 0 is tension (checked
+# against phi_Tn per H1.2; without phi_Tn a tension demand is unchecked and
+# fails). Moments enter in absolute value.
+# Units: kip, kip-in.
+
+
+@dataclass(frozen=True)
+class InteractionBatch:
+    """
+    Result of interaction_batch for n members × m combinations.
+        - ratio: H1-1a / H1-1b left-hand side (inf where a demand has no
+          capacity to be checked against)
+        - h1_1a: True where Pr/Pc >= 0.2 (H1-1a governs the equation)
+        - governing_index / governing_ratio: worst combination per member
+    """
+
+    tags: tuple[str, ...]
+    ratio: np.ndarray
+    h1_1a: np.ndarray
+    governing_index: np.ndarray
+    governing_ratio: np.ndarray
+
+    @property
+    def governing_tags(self) -> np.ndarray:
+        return np.asarray(self.tags)[self.governing_index]
+
+    @property
+    def passed(self) -> np.ndarray:
+        return self.governing_ratio <= 1.0
+
+
+def _utilization(demand: np.ndarray, capacity: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = np.abs(demand) / capacity
+    return np.where(demand == 0, 0.0, np.where(np.isnan(u), np.inf, u))
+
+
+def interaction_batch(
+    Pu,
+    Mux,
+    Muy,
+    phi_Pn,
+    phi_Mnx,
+    phi_Mny=np.nan,
+    phi_Tn=None,
+    tags: tuple[str, ...] | None = None,
+    chunk: int = 4096,
+) -> InteractionBatch:
+    """
+    H1-1a / H1-1b for every member × combination in one pass.
+        - Pu, Mux, Muy: (n × m) demands, or (m,) shared by every member
+        - phi_Pn, phi_Mnx, phi_Mny, phi_Tn: (n,) capacities; rows with
+          Pu < 0 need phi_Tn (e.g. tension_batch), or their ratio is inf
+        - tags: combination names (defaults to "1".."m")
+    Members are processed chunk rows at a time to bound temporaries.
+    """
+    Pu, Mux, Muy = (
+        np.atleast_2d(np.asarray(x, dtype=np.float64)) for x in (Pu, Mux, Muy)
+    )
+    n = max(np.size(phi_Pn), np.size(phi_Mnx), Pu.shape[0], Mux.shape[0], Muy.shape[0])
+    m = max(Pu.shape[1], Mux.shape[1], Muy.shape[1])
+    Pu, Mux, Muy = (np.broadcast_to(x, (n, m)) for x in (Pu, Mux, Muy))
+
+    phi_Pn, phi_Mnx, phi_Mny = (
+        np.broadcast_to(np.asarray(x, dtype=np.float64), n)[:, None]
+        for x in (phi_Pn, phi_Mnx, phi_Mny)
+    )
+    # phi_Pn says nothing of net-section rupture, so it never stands in
+    # for phi_Tn
+    phi_Tn = np.broadcast_to(
+        np.asarray(np.nan if phi_Tn is None else phi_Tn, dtype=np.float64), n
+    )[:, None]
+    tags = tuple(tags) if tags is not None else tuple(str(k + 1) for k in range(m))
+    if len(tags) != m:
+        raise ValueError(f"Expected {m} combination tags, got {len(tags)}.")
+
+    ratio = np.empty((n, m))
+    h1_1a = np.empty((n, m), dtype=bool)
+
+    for start in range(0, n, chunk):
+        rows = slice(start, start + chunk)
+        P = Pu[rows]
+
+        pr = _utilization(P, np.where(P < 0, phi_Tn[rows], phi_Pn[rows]))
+        mr = _utilization(Mux[rows], phi_Mnx[rows]) + _utilization(
+            Muy[rows], phi_Mny[rows]
+        )
+
+        h1_1a[rows] = pr >= 0.2
+        ratio[rows] = np.where(h1_1a[rows], pr + (8 / 9) * mr, pr / 2 + mr)
+
+    governing_index = ratio.argmax(axis=1)
+
+    return InteractionBatch(
+        tags=tags,
+        ratio=ratio,
+        h1_1a=h1_1a,
+        governing_index=governing_index,
+        governing_ratio=ratio[np.arange(n), governing_index],
+    )
+
+
+def interaction_from_loads(
+    P,
+    Mx,
+    My,
+    phi_Pn,
+    phi_Mnx,
+    phi_Mny=np.nan,
+    phi_Tn=None,
+    special_case: bool = False,
+) -> InteractionBatch:
+    """
+    interaction_batch over the E.060 combinations, from (n × n_load_types)
+    service load effects per member (columns in LOAD_TYPES order), combined
+    with the same factor matrix as combinaciones.combine.
+    """
+    tags, matrix = combination_matrix(special_case)
+    Pu, Mux, Muy = (
+        np.atleast_2d(np.asarray(x, dtype=np.float64)) @ matrix.T for x in (P, Mx, My)
+    )
+    return interaction_batch(
+        Pu, Mux, Muy, phi_Pn, phi_Mnx, phi_Mny, phi_Tn=phi_Tn, tags=tags
+    )
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,365 @@
+import os
+import time
+import logging
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from etc.paths import local_paths
+from .definiciones import Steel
+from .elementos import ElementTable
+from .memoria import ResultCache
+from .secciones import SectionCatalog, catalog as default_catalog
+from .traza import set_quiet
+
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------
+# Schedule
+# ----------------
+#
+# One row per member. Lengths in in, forces in kip, moments in kip-in,
+# service loads (dead, live) in kip/in, stresses in ksi.
+
+REQUIRED_COLUMNS = ("name", "shape", "L")
+
+DEFAULTS: dict[str, float] = {
+    "Lb": np.nan,  # NaN → L
+    "cb": 1.0,
+    "Kx": 1.0,
+    "Ky": 1.0,
+    "a": np.nan,  # unstiffened web
+    "Fy": 36.0,
+    "E": 29_000.0,
+    "Mu": 0.0,
+    "Vu": 0.0,
+    "Pu": 0.0,
+    "dead": 0.0,
+    "live": 0.0,
+}
+
+CHECKS = ("flexure", "shear", "compression", "deflection")
+
+
+def read_schedule(path: Path) -> pl.DataFrame:
+    """
+    Member schedule from CSV, Parquet or YAML (a list of members, or a
+    mapping with a "members" list).
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        df = pl.read_csv(path)
+    elif suffix == ".parquet":
+        df = pl.read_parquet(path)
+    elif suffix in (".yaml", ".yml"):
+        import yaml
+
+        with open(path, "r", encoding="utf-8") as file:
+            data = yaml.safe_load(file)
+        df = pl.DataFrame(data["members"] if isinstance(data, dict) else data)
+    else:
+        raise ValueError(f"Unsupported schedule format: {path.suffix}")
+
+    return normalize_schedule(df, path.name)
+
+
+def normalize_schedule(df: pl.DataFrame, source: str = "schedule") -> pl.DataFrame:
+    """
+    Check the required columns, fill the optional ones with DEFAULTS and
+    cast every numeric column to Float64, so schedules (or requests) that
+    spell lengths as integers concatenate with the rest.
+    """
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"{source} is missing columns: {missing}")
+
+    return df.with_columns(
+        pl.col("name").cast(pl.Utf8),
+        pl.col("shape").cast(pl.Utf8),
+        pl.col("L").cast(pl.Float64),
+        *(
+            (
+                pl.col(c).cast(pl.Float64).fill_null(default)
+                if c in df.columns
+                else pl.lit(default, dtype=pl.Float64)
+            ).alias(c)
+            for c, default in DEFAULTS.items()
+        ),
+    ).with_columns(pl.col("Lb").fill_nan(pl.col("L")))
+
+
+# ----------------
+# Checks
+# ----------------
+
+
+def _ratio(demand: np.ndarray, capacity: np.ndarray) -> np.ndarray:
+    # No demand never governs; a demand the section cannot be checked for
+    # (NaN capacity) always fails
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.abs(demand) / capacity
+    return np.where(demand == 0, 0.0, np.where(np.isnan(ratio), np.inf, ratio))
+
+
+# Inputs that determine the capacities (the demands do not)
+CAPACITY_INPUTS = ("shape", "E", "Fy", "L", "Lb", "cb", "Kx", "Ky", "a")
+_CAPACITY_NAMES = ("phi_Mn", "phi_Vn", "phi_Pn")
+
+
+def capacities(
+    df: pl.DataFrame,
+    catalog: SectionCatalog | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    phi_Mn, phi_Vn and phi_Pn of every row (NaN where not computable),
+    from the batch counterparts of FlexedElement, ShearedElement and
+    CompressedElement.
+    """
+    E_Fy = df.select("E", "Fy").to_numpy()
+    pairs, material = np.unique(E_Fy, axis=0, return_inverse=True)
+
+    elements = ElementTable.from_frame(
+        df.with_columns(
+            pl.Series("material", material.ravel()),
+            pl.Series("name", np.arange(df.height)),
+        ),
+        [Steel(E=E, Fy=Fy) for E, Fy in pairs],
+        catalog=catalog,
+    )
+
+    return {
+        "phi_Mn": elements.flexure().phi_Mn,
+        "phi_Vn": elements.shear().phi_Vn,
+        "phi_Pn": elements.compression().phi_Pn,
+    }
+
+
+def cached_capacities(
+    df: pl.DataFrame,
+    cache: ResultCache,
+    catalog: SectionCatalog | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    capacities() through the result cache: each distinct set of inputs is
+    looked up once, and only the misses are computed (and stored).
+    """
+    inputs = df.select(CAPACITY_INPUTS)
+    unique = inputs.unique(maintain_order=True)
+    keys = [cache.key("capacities", row) for row in unique.iter_rows(named=True)]
+
+    found = cache.get_many(keys)
+    missing = [i for i, key in enumerate(keys) if key not in found]
+
+    if missing:
+        computed = capacities(unique[missing], catalog)
+        new = {
+            keys[i]: [float(computed[name][k]) for name in _CAPACITY_NAMES]
+            for k, i in enumerate(missing)
+        }
+        cache.put_many(new)
+        found.update(new)
+
+    values = np.array([found[key] for key in keys], dtype=np.float64).reshape(-1, 3)
+    row = (
+        inputs.with_row_index("_row")
+        .join(unique.with_row_index("_unique"), on=CAPACITY_INPUTS, nulls_equal=True)
+        .sort("_row")
+        .get_column("_unique")
+        .to_numpy()
+    )
+    return {name: values[row, k] for k, name in enumerate(_CAPACITY_NAMES)}
+
+
+def check_members(
+    df: pl.DataFrame,
+    catalog: SectionCatalog | None = None,
+    cache: ResultCache | None = None,
+) -> pl.DataFrame:
+    """
+    Demand/capacity ratios of a schedule (as returned by read_schedule)
+    for flexure, shear, compression and deflection, the governing check
+    and whether the member passes. Capacities match FlexedElement,
+    ShearedElement and CompressedElement; deflection uses
+    FlexedElement.deflection_test limits (L/360 live, L/240 dead + live,
+    both strict). Flexure of shapes other than W is not supported by the
+    batch runner: their phi_Mn is NaN, so any Mu fails them (a deliberate,
+    conservative departure; FlexedElement computes some of these).
+    With a cache, capacities computed by earlier runs are reused.
+    """
+    phi = (
+        capacities(df, catalog)
+        if cache is None
+        else cached_capacities(df, cache, catalog)
+    )
+    phi_Mn, phi_Vn, phi_Pn = (phi[name] for name in _CAPACITY_NAMES)
+
+    # Flexure of non-W shapes is not supported here: no flexural capacity
+    shapes = df.get_column("shape")
+    phi_Mn = np.where(shapes.str.starts_with("W").to_numpy(), phi_Mn, np.nan)
+
+    sections = (catalog or default_catalog).section_table("wsmhp")
+    ix = sections.column("ix")[
+        [sections.index(shape) for shape in df.get_column("shape").to_list()]
+    ]
+    L, E = (df.get_column(c).to_numpy() for c in ("L", "E"))
+    dead, live = (df.get_column(c).to_numpy() for c in ("dead", "live"))
+
+    with np.errstate(invalid="ignore"):
+        live_deflection = (5 / 384) * live * L**4 / (E * ix)
+        dead_live_deflection = (5 / 384) * (dead + live) * L**4 / (E * ix)
+
+    ratios = np.column_stack(
+        [
+            _ratio(df.get_column("Mu").to_numpy(), phi_Mn),
+            _ratio(df.get_column("Vu").to_numpy(), phi_Vn),
+            _ratio(df.get_column("Pu").to_numpy(), phi_Pn),
+            np.maximum(
+                np.where(live == 0, 0.0, _ratio(live_deflection, L / 360)),
+                np.where(dead + live == 0, 0.0, _ratio(dead_live_deflection, L / 240)),
+            ),
+        ]
+    )
+    governing = ratios.argmax(axis=1)
+    ratio = ratios[np.arange(governing.size), governing]
+
+    # Deflection must stay strictly below its limits, as in deflection_test
+    ok = (ratios[:, :3].max(axis=1) <= 1.0) & (ratios[:, 3] < 1.0)
+
+    return pl.DataFrame(
+        {
+            "name": df.get_column("name"),
+            "shape": df.get_column("shape"),
+            "phi_Mn": phi_Mn,
+            "phi_Vn": phi_Vn,
+            "phi_Pn": phi_Pn,
+            **{f"{check}_ratio": ratios[:, k] for k, check in enumerate(CHECKS)},
+            "governing": np.asarray(CHECKS)[governing],
+            "ratio": ratio,
+            "ok": ok,
+        }
+    )
+
+
+# ----------------
+# Process pool
+# ----------------
+
+_worker_catalog: SectionCatalog | None = None
+_worker_cache: ResultCache | None = None
+
+
+def _init_worker(db_path: Path | None, cache_path: Path | None = None) -> None:
+    global _worker_catalog, _worker_cache
+    set_quiet()
+    _worker_catalog = SectionCatalog(db_path) if db_path else default_catalog
+    _worker_catalog.load()
+    _worker_cache = (
+        ResultCache(cache_path, catalog=_worker_catalog) if cache_path else None
+    )
+
+
+def _check_chunk(df: pl.DataFrame) -> pl.DataFrame:
+    return check_members(df, _worker_catalog, _worker_cache)
+
+
+def run(
+    schedule_path: Path,
+    output_path: Path | None = None,
+    chunk: int = 5_000,
+    workers: int | None = None,
+    db_path: Path | None = None,
+    cache_path: Path | None = None,
+) -> pl.DataFrame:
+    """
+    Check every member of a schedule in a process pool, chunk rows per
+    task, and write the results to Parquet (by default next to the other
+    generated files, as <schedule>_results.parquet). With cache_path,
+    capacities are memoized in a ResultCache shared by all workers.
+    """
+    start = time.perf_counter()
+
+    schedule_path = Path(schedule_path)
+    output_path = (
+        output_path or local_paths.cache / f"{schedule_path.stem}_results.parquet"
+    )
+    workers = workers or os.cpu_count() or 1
+
+    df = read_schedule(schedule_path)
+    chunks = [df.slice(offset, chunk) for offset in range(0, df.height, chunk)] or [df]
+    logger.info(
+        f"▶ {df.height} members from {schedule_path.name} "
+        f"({len(chunks)} chunks, {workers} workers)"
+    )
+
+    if workers == 1 or len(chunks) <= 1:
+        _init_worker(db_path, cache_path)
+        results = [_check_chunk(c) for c in chunks]
+    else:
+        # Spawned, not forked: a forked child can inherit a locked Polars
+        # thread pool and hang
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(db_path, cache_path),
+        ) as pool:
+            results = list(pool.map(_check_chunk, chunks))
+
+    result = pl.concat(results)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    result.write_parquet(output_path)
+
+    elapsed = time.perf_counter() - start
+    failed = result.height - result.get_column("ok").sum()
+    logger.info(f"✔ {result.height} members checked, {failed} failing → {output_path}")
+    logger.info(
+        f"  ↳ {elapsed:.2f} s ({result.height / elapsed:,.0f} members/s)"
+        if elapsed > 0
+        else f"  ↳ {elapsed:.2f} s"
+    )
+
+    return result
+
+
+# ----------------
+# Command line
+# ----------------
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m megara.lote",
+        description="Check a member schedule and write the ratios to Parquet.",
+    )
+    parser.add_argument("schedule", type=Path, help="CSV, Parquet or YAML schedule")
+    parser.add_argument("-o", "--output", type=Path, default=None)
+    parser.add_argument("--chunk", type=int, default=5_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--db", type=Path, default=None, help="sections.db path")
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        nargs="?",
+        const=local_paths.cache / "results.sqlite",
+        default=None,
+        help="memoize capacities in this SQLite file",
+    )
+    args = parser.parse_args(argv)
+
+    run(args.schedule, args.output, args.chunk, args.workers, args.db, args.cache)
+
+
+if __name__ == "__main__":
+    from etc.settings import setup_logging
+
+    setup_logging()
+    main()
@@ -0,0 +1,298 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import importlib.util
+import logging
+import threading
+from dataclasses import astuple
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+from etc.paths import local_paths
+from .definiciones import Element
+from . import flexión, compresión, cortante
+from .secciones import SectionCatalog, catalog as default_catalog
+
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------
+# Keys
+# ----------------
+
+
+def canonical(value: Any) -> Any:
+    """
+    JSON-ready form of an input, so that equal inputs hash equally
+    (numbers as floats, so 120 and 120.0 match; None stays None).
+    """
+    if isinstance(value, Mapping):
+        return {str(k): canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonical(v) for v in value]
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    return float(value)
+
+
+# Every module between the inputs and a cached result: the limit states,
+# the batch path that feeds them and the section data they read
+_CODE_MODULES = (
+    "flexión",
+    "compresión",
+    "cortante",
+    "definiciones",
+    "elementos",
+    "secciones",
+    "lote",
+)
+
+
+def _code_version() -> str:
+    # Results change when that code does. Sources are read from the files,
+    # not imported, since lote itself imports this module
+    digest = hashlib.sha256()
+    for name in _CODE_MODULES:
+        spec = importlib.util.find_spec(f"{__package__}.{name}")
+        digest.update(Path(spec.origin).read_bytes())
+    return digest.hexdigest()
+
+
+# Section properties the limit states read; hashed along with the shape so a
+# hand-made Section never reuses the result of a catalog one
+_SECTION_INPUTS = (
+    "a",
+    "j",
+    "d",
+    "ix",
+    "sx",
+    "rx",
+    "iy",
+    "ry",
+    "cw",
+    "tw",
+    "bf",
+    "tf",
+    "t",
+    "zx",
+)
+
+
+def element_inputs(element: Element) -> dict[str, Any]:
+    section = element.section
+    return {
+        "shape": section.shape,
+        "section": [getattr(section, name) for name in _SECTION_INPUTS],
+        "material": astuple(element.material),
+        "L": element.L,
+        "Kx": element.Kx,
+        "Ky": element.Ky,
+    }
+
+
+# ----------------
+# Cache
+# ----------------
+
+
+class ResultCache:
+    """
+    Persistent memo of design results in SQLite (WAL mode, one connection
+    per process and thread), shared by every process that opens the same
+    file. Keys hash the canonical inputs, the catalog version and the
+    limit-state code; values are JSON. Once the stored values exceed
+    max_bytes, the least recently used entries are evicted down to 90 %.
+    """
+
+    _chunk = 500
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_bytes: int = 256 * 2**20,
+        catalog: SectionCatalog | None = None,
+    ):
+        self.path = Path(path or local_paths.cache / "results.sqlite")
+        self.max_bytes = max_bytes
+        self.catalog = catalog or default_catalog
+        self._local = threading.local()
+        self._salt: str | None = None
+
+    # ----------------
+    # Connection
+    # ----------------
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)"
+            )
+            local.conn, local.pid = conn, os.getpid()
+        return local.conn
+
+    def close(self) -> None:
+        if getattr(self._local, "pid", None) == os.getpid():
+            self._local.conn.close()
+        self._local = threading.local()
+
+    # ----------------
+    # Keys
+    # ----------------
+
+    def key(self, kind: str, inputs: Mapping[str, Any]) -> str:
+        if self._salt is None:
+            self._salt = f"{self.catalog.version}:{_code_version()}"
+        payload = json.dumps(
+            [kind, canonical(inputs), self._salt],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # ----------------
+    # Get / put
+    # ----------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, Any] = {}
+        conn = self._conn
+
+        for start in range(0, len(keys), self._chunk):
+            chunk = keys[start : start + self._chunk]
+            marks = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, value FROM results WHERE key IN ({marks})", chunk
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    f"UPDATE results SET accessed = ? WHERE key IN ({marks})",
+                    [time.time(), *(key for key, _ in rows)],
+                )
+            found.update((key, json.loads(value)) for key, value in rows)
+
+        return found
+
+    def put(self, key: str, value: Any) -> None:
+        self.put_many({key: value})
+
+    def put_many(self, items: Mapping[str, Any]) -> None:
+        if not items:
+            return
+
+        now = time.time()
+        rows = []
+        for key, value in items.items():
+            data = json.dumps(value)
+            rows.append((key, data, len(data), now))
+
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", rows)
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT total(size) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - 0.9 * self.max_bytes
+        evicted: list[str] = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM results ORDER BY accessed"
+        ):
+            evicted.append(key)
+            excess -= size
+            if excess <= 0:
+                break
+
+        for start in range(0, len(evicted), self._chunk):
+            chunk = evicted[start : start + self._chunk]
+            conn.execute(
+                f"DELETE FROM results WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+        logger.debug(f"Evicted {len(evicted)} cached results")
+
+    def memoize(
+        self,
+        kind: str,
+        inputs: Mapping[str, Any],
+        compute: Callable[[], Any],
+    ) -> Any:
+        key = self.key(kind, inputs)
+        found = self.get_many([key])
+        if key in found:
+            return found[key]
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    # ----------------
+    # Maintenance
+    # ----------------
+
+    def stats(self) -> dict[str, int]:
+        entries, size = self._conn.execute(
+            "SELECT count(*), total(size) FROM results"
+        ).fetchone()
+        return {"entries": entries, "bytes": int(size)}
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM results")
+
+
+# ----------------
+# Limit states
+# ----------------
+
+
+def cached_phi_Mn(element: Element, Lb: float, cb: float, cache: ResultCache) -> float:
+    return cache.memoize(
+        "phi_Mn",
+        {**element_inputs(element), "Lb": Lb, "cb": cb},
+        lambda: float(flexión.FlexedElement(element, Lb, cb).phi_Mn),
+    )
+
+
+def cached_phi_Pn(element: Element, cache: ResultCache) -> float:
+    return cache.memoize(
+        "phi_Pn",
+        element_inputs(element),
+        lambda: float(compresión.CompressedElement(element).phi_Pn),
+    )
+
+
+def cached_phi_Vn(element: Element, cache: ResultCache, a: float | None = None):
+    return cache.memoize(
+        "phi_Vn",
+        {**element_inputs(element), "a": a},
+        lambda: float(cortante.ShearedElement(element, a=a).phi_Vn),
+    )
+
+
+if __name__ == "__main__":
+    pass
@@ -1,35 +1,322 @@
-from typing import Any
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Iterable
 
 import duckdb
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.ipc as ipc
 
 from etc.paths import local_paths
+from .definiciones import (
+    _SECTION_FIELDS,
+    AngleSection,
+    ChannelSection,
+    CompactSection,
+    DoubleAngleSection,
+    PipeSection,
+    RolledSection,
+    Section,
+    TeeSection,
+    TubeSection,
+)
 
 
-def check_result(df, profile_name) -> None:
-    if df.is_empty():
-        raise ValueError(f"Profile '{profile_name}' not found in wshmp")
+FAMILIES: tuple[str, ...] = (
+    "wsmhp",
+    "cmc",
+    "wt",
+    "angles",
+    "two_angles",
+    "tubes",
+    "pipes",
+)
 
-    if df.height != 1:
-        raise ValueError(f"Profile '{profile_name}' is not unique in wshmp")
+FAMILY_SECTIONS: dict[str, type[CompactSection]] = {
+    "wsmhp": RolledSection,
+    "cmc": ChannelSection,
+    "wt": TeeSection,
+    "angles": AngleSection,
+    "two_angles": DoubleAngleSection,
+    "tubes": TubeSection,
+    "pipes": PipeSection,
+}
 
 
-def read_wshmp_section(profile_name: str):
-    with duckdb.connect(local_paths.db / "sections.db") as conn:
-        query = conn.execute(
-            """
-            select *
-            from wsmhp
-            where shape = ?
-        """,
-            [profile_name],
-        )
-        result = query.pl()
+class SectionCatalog:
+    """
+    Process-wide section catalog.
+    Every family table in sections.db is read once, on first use, and kept
+    in memory as a Polars DataFrame with a hash index by shape name.
+    Families exported by the migration as Arrow IPC files (<family>.arrow,
+    next to sections.db) are memory-mapped instead, so every process shares
+    the same read-only pages; DuckDB is only opened for the rest.
+    """
 
-        check_result(result, profile_name)
+    def __init__(self, db_path: Path | str | None = None, use_arrow: bool = True):
+        self.db_path = Path(db_path or local_paths.db / "sections.db")
+        self.use_arrow = use_arrow
+        self._tables: dict[str, pl.DataFrame] = {}
+        self._index: dict[str, dict[str, int]] = {}
+        self._duplicates: dict[str, set[str]] = {}
+        self._section_tables: dict[str, SectionTable] = {}
+        self._version: str | None = None
+        self._lock = threading.Lock()
+        self._loaded = False
 
-        row: dict[str, Any] = result.row(0, named=True)
+    # ----------------
+    # Loading
+    # ----------------
 
-        return row
+    def load(self) -> None:
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+
+            missing: list[str] = []
+            for family in FAMILIES:
+                path = self.arrow_path(family)
+                if self.use_arrow and path.exists():
+                    self._add_table(family, read_arrow(path))
+                else:
+                    missing.append(family)
+
+            if missing:
+                with duckdb.connect(self.db_path, read_only=True) as conn:
+                    existing = {
+                        name
+                        for (name,) in conn.execute(
+                            "select table_name from information_schema.tables"
+                        ).fetchall()
+                    }
+                    for family in missing:
+                        if family in existing:
+                            self._add_table(
+                                family, conn.execute(f"select * from {family}").pl()
+                            )
+
+            self._loaded = True
+
+    @property
+    def version(self) -> str:
+        """
+        Identifies the catalog contents: the content and normalization
+        hashes the migration recorded in sections.db, or, for a database
+        without them, its size and modification time.
+        """
+        if self._version is None:
+            digest = hashlib.sha256()
+            with duckdb.connect(self.db_path, read_only=True) as conn:
+                recorded = conn.execute(
+                    "select count(*) from information_schema.tables "
+                    "where table_name = '_migration'"
+                ).fetchone()[0]
+                rows = (
+                    conn.execute(
+                        "select name, content_hash, step_hash from _migration "
+                        "where name != '__workbook__' order by name"
+                    ).fetchall()
+                    if recorded
+                    else []
+                )
+            if not rows:
+                stat = self.db_path.stat()
+                rows = [(str(self.db_path.resolve()), stat.st_size, stat.st_mtime_ns)]
+            for row in rows:
+                digest.update(repr(row).encode())
+            self._version = digest.hexdigest()
+        return self._version
+
+    def arrow_path(self, family: str) -> Path:
+        return self.db_path.parent / f"{family}.arrow"
+
+    def _add_table(self, family: str, df: pl.DataFrame) -> None:
+        index: dict[str, int] = {}
+        duplicates: set[str] = set()
+
+        for i, shape in enumerate(df.get_column("shape").to_list()):
+            if shape in index:
+                duplicates.add(shape)
+            index[shape] = i
+
+        self._tables[family] = df
+        self._index[family] = index
+        self._duplicates[family] = duplicates
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self._index.clear()
+            self._duplicates.clear()
+            self._section_tables.clear()
+            self._version = None
+            self._loaded = False
+
+    # ----------------
+    # Lookup
+    # ----------------
+
+    @property
+    def families(self) -> tuple[str, ...]:
+        self.load()
+        return tuple(self._tables)
+
+    def table(self, family: str) -> pl.DataFrame:
+        self.load()
+        if family not in self._tables:
+            raise KeyError(f"Family '{family}' not found in {self.db_path.name}")
+        return self._tables[family]
+
+    def locate(self, shape: str, family: str | None = None) -> tuple[str, int]:
+        self.load()
+        for name in (family,) if family else self._tables:
+            index = self._index.get(name, {})
+            if shape in index:
+                if shape in self._duplicates[name]:
+                    raise ValueError(f"Profile '{shape}' is not unique in {name}")
+                return name, index[shape]
+
+        raise ValueError(f"Profile '{shape}' not found in {family or 'catalog'}")
+
+    def row(self, shape: str, family: str | None = None) -> dict[str, Any]:
+        family, i = self.locate(shape, family)
+        return self._tables[family].row(i, named=True)
+
+    def get(self, shape: str, family: str | None = None) -> Section:
+        return _to_section(self.row(shape, family))
+
+    def get_compact(self, shape: str, family: str | None = None) -> CompactSection:
+        family, i = self.locate(shape, family)
+        return _to_compact(family, self._tables[family].row(i, named=True))
+
+    def section_table(self, family: str) -> "SectionTable":
+        table = self.table(family)
+        if family not in self._section_tables:
+            self._section_tables[family] = SectionTable(family, table)
+        return self._section_tables[family]
+
+    def get_many(
+        self,
+        shapes: Iterable[str],
+        family: str | None = None,
+    ) -> list[Section]:
+        located = [self.locate(shape, family) for shape in shapes]
+
+        rows_by_family: dict[str, list[int]] = {}
+        for name, i in located:
+            rows_by_family.setdefault(name, []).append(i)
+
+        rows = {
+            name: iter(self._tables[name][idx].to_dicts())
+            for name, idx in rows_by_family.items()
+        }
+        return [_to_section(next(rows[name])) for name, _ in located]
+
+
+def read_arrow(path: Path) -> pl.DataFrame:
+    """
+    Zero-copy read of an uncompressed Arrow IPC file: the columns point into
+    the memory-mapped file.
+    """
+    return pl.from_arrow(ipc.open_file(pa.memory_map(str(path))).read_all())
+
+
+def _to_section(row: dict[str, Any]) -> Section:
+    return Section(**{k: v for k, v in row.items() if k in _SECTION_FIELDS})
+
+
+def _to_compact(family: str, row: dict[str, Any]) -> CompactSection:
+    cls = FAMILY_SECTIONS[family]
+    names = cls.__slots__
+    return cls(**{k: v for k, v in row.items() if k in names})
+
+
+# ----------------
+# Struct of arrays
+# ----------------
+
+
+class SectionTable:
+    """
+    One family as a struct of arrays: shape names plus one float64 array
+    per Section field (NaN where the catalog has no value). Rows are handed
+    out as SectionRow views, which the limit-state classes accept in place
+    of a Section.
+    """
+
+    def __init__(self, family: str, df: pl.DataFrame):
+        self.family = family
+        self.shapes: np.ndarray = df.get_column("shape").to_numpy()
+        self.columns: dict[str, np.ndarray] = {
+            name: df.get_column(name).cast(pl.Float64, strict=False).to_numpy()
+            for name in df.columns
+            if name in _SECTION_FIELDS and name != "shape"
+        }
+        self._index = {shape: i for i, shape in enumerate(self.shapes)}
+
+    def __len__(self) -> int:
+        return self.shapes.size
+
+    def __getitem__(self, key: int | str) -> "SectionRow":
+        return SectionRow(self, self.index(key) if isinstance(key, str) else key)
+
+    def index(self, shape: str) -> int:
+        if shape not in self._index:
+            raise ValueError(f"Profile '{shape}' not found in {self.family}")
+        return self._index[shape]
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in self.columns:
+            return np.full(len(self), np.nan)
+        return self.columns[name]
+
+    def to_section(self, key: int | str) -> CompactSection:
+        i = self.index(key) if isinstance(key, str) else key
+        row = {name: values[i] for name, values in self.columns.items()}
+        row = {k: None if np.isnan(v) else float(v) for k, v in row.items()}
+        return _to_compact(self.family, {**row, "shape": str(self.shapes[i])})
+
+
+class SectionRow:
+    """
+    Read-only view of one row of a SectionTable; fields the family lacks,
+    or that are NaN, read as None, as they would in a Section.
+    """
+
+    __slots__ = ("_table", "_i")
+
+    def __init__(self, table: SectionTable, i: int):
+        self._table = table
+        self._i = i
+
+    def __getattr__(self, name: str) -> Any:
+        table = self._table
+        if name == "shape":
+            return str(table.shapes[self._i])
+
+        values = table.columns.get(name)
+        if values is None:
+            if name in _SECTION_FIELDS:
+                return None
+            raise AttributeError(f"'SectionRow' object has no attribute '{name}'")
+
+        value = values[self._i]
+        return None if np.isnan(value) else float(value)
+
+    def __repr__(self) -> str:
+        return f"SectionRow({self._table.family}, {self.shape})"
+
+
+catalog = SectionCatalog()
+
+
+def read_wshmp_section(profile_name: str) -> dict[str, Any]:
+    return catalog.row(profile_name, "wsmhp")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,346 @@
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import polars as pl
+
+from .definiciones import Steel
+from .flexión import flexure_batch
+from .cortante import shear_batch
+from .compresión import compression_batch
+from .secciones import SectionCatalog, catalog as default_catalog
+
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------
+# Helpers
+# ----------------
+
+
+def _sorted_by_weight(
+    catalog: SectionCatalog | None,
+    prefix: str,
+    columns: tuple[str, ...],
+) -> pl.DataFrame:
+    return (
+        (catalog or default_catalog)
+        .table("wsmhp")
+        .filter(pl.col("shape").str.starts_with(prefix))
+        .drop_nulls(["wt_ft", *columns])
+        .sort("wt_ft", maintain_order=True)
+    )
+
+
+def _first_passing(rows: np.ndarray, passed: np.ndarray, n: int) -> np.ndarray:
+    """
+    Position in rows of the first passing candidate of each of the n demands,
+    or -1. Candidates come from np.nonzero over shapes sorted by weight, so
+    the first pass is the lightest.
+    """
+    first = np.full(n, -1)
+    pass_rows, k = np.unique(rows[passed], return_index=True)
+    first[pass_rows] = np.flatnonzero(passed)[k]
+    return first
+
+
+# ----------------
+# Beams
+# ----------------
+
+_BEAM_COLUMNS = ("d", "tf", "tw", "bf", "ry", "sx", "zx", "j", "iy", "cw", "t", "ix")
+
+
+@dataclass(frozen=True)
+class BeamSelection:
+    shape: str
+    wt_ft: float
+    phi_Mn: float
+    phi_Vn: float
+    live_deflection: float
+    dead_live_deflection: float
+
+
+class BeamSelector:
+    """
+    Lightest W shape passing flexure, shear and deflection. The prefix
+    narrows the W shapes (e.g. "W12"); other families are rejected, since
+    FlexedElement only handles W shapes.
+    Shapes are kept sorted by weight. Shear and deflection are exact
+    per-shape tests and, together with a lower bound on Zx, discard most
+    shapes before the survivors go through flexure_batch (same results as
+    FlexedElement, ShearedElement and FlexedElement.deflection_test).
+    Units follow the rest of megara: kip, in, ksi.
+    """
+
+    chunk = 512
+
+    def __init__(
+        self,
+        material: Steel,
+        catalog: SectionCatalog | None = None,
+        prefix: str = "W",
+    ):
+        if not prefix.startswith("W"):
+            raise ValueError(
+                f"BeamSelector only checks W shapes, got prefix {prefix!r}"
+            )
+
+        self.material = material
+        self.prefix = prefix
+
+        df = _sorted_by_weight(catalog, prefix, _BEAM_COLUMNS)
+
+        self.shapes: np.ndarray = df.get_column("shape").to_numpy()
+        self.wt_ft: np.ndarray = df.get_column("wt_ft").to_numpy()
+        self.props: dict[str, np.ndarray] = {
+            name: df.get_column(name).cast(pl.Float64).to_numpy()
+            for name in _BEAM_COLUMNS
+        }
+
+        # Shear does not depend on the demand, so it is evaluated once
+        self.phi_Vn: np.ndarray = shear_batch(
+            self.props["d"],
+            self.props["tw"],
+            self.props["t"],
+            self.shapes,
+            material.Fy,
+            material.E,
+        ).phi_Vn
+
+    def select(
+        self,
+        Mu: float,
+        Vu: float,
+        L: float,
+        Lb: float,
+        cb: float,
+        dead: float = 0.0,
+        live: float = 0.0,
+    ) -> BeamSelection | None:
+        return self.select_many(Mu, Vu, L, Lb, cb, dead, live)[0]
+
+    def select_many(
+        self,
+        Mu,
+        Vu,
+        L,
+        Lb,
+        cb,
+        dead=0.0,
+        live=0.0,
+    ) -> list[BeamSelection | None]:
+        demands = [
+            np.ravel(x)
+            for x in np.broadcast_arrays(
+                *(
+                    np.asarray(x, dtype=np.float64)
+                    for x in (Mu, Vu, L, Lb, cb, dead, live)
+                )
+            )
+        ]
+
+        selections: list[BeamSelection | None] = []
+        for start in range(0, demands[0].size, self.chunk):
+            selections.extend(
+                self._select_chunk(*(x[start : start + self.chunk] for x in demands))
+            )
+        return selections
+
+    def _select_chunk(
+        self,
+        Mu: np.ndarray,
+        Vu: np.ndarray,
+        L: np.ndarray,
+        Lb: np.ndarray,
+        cb: np.ndarray,
+        dead: np.ndarray,
+        live: np.ndarray,
+    ) -> list[BeamSelection | None]:
+        E, Fy = self.material.E, self.material.Fy
+        ix = self.props["ix"]
+
+        # ---- Pruning (beams × shapes)
+        # phi_Mn <= 0.9 * cb * Mp for cb >= 1 (inelastic Mn is not capped)
+        zx_min = Mu / (0.9 * Fy * np.maximum(cb, 1.0))
+        live_deflection = (5 / 384) * (live * L**4)[:, None] / (E * ix)
+        dead_live_deflection = (5 / 384) * ((dead + live) * L**4)[:, None] / (E * ix)
+
+        mask = (
+            (self.props["zx"] >= zx_min[:, None])
+            & (self.phi_Vn >= Vu[:, None])
+            & (live_deflection < (L / 360)[:, None])
+            & (dead_live_deflection < (L / 240)[:, None])
+        )
+
+        # ---- Full flexure check on the survivors only
+        rows, cols = np.nonzero(mask)
+        flexure = flexure_batch(
+            **{k: v[cols] for k, v in self.props.items() if k != "ix"},
+            Lb=Lb[rows],
+            cb=cb[rows],
+            Fy=Fy,
+            E=E,
+        )
+        passed = flexure.phi_Mn >= Mu[rows]
+
+        first = _first_passing(rows, passed, Mu.size)
+
+        selections: list[BeamSelection | None] = []
+        for b, k in enumerate(first):
+            if k < 0:
+                logger.warning(f"No {self.prefix} shape passes Mu={Mu[b]}, Vu={Vu[b]}")
+                selections.append(None)
+                continue
+
+            i = cols[k]
+            selections.append(
+                BeamSelection(
+                    shape=str(self.shapes[i]),
+                    wt_ft=float(self.wt_ft[i]),
+                    phi_Mn=float(flexure.phi_Mn[k]),
+                    phi_Vn=float(self.phi_Vn[i]),
+                    live_deflection=float(live_deflection[b, i]),
+                    dead_live_deflection=float(dead_live_deflection[b, i]),
+                )
+            )
+        return selections
+
+
+# ----------------
+# Columns
+# ----------------
+
+_COLUMN_COLUMNS = ("a", "rx", "ry", "bf", "tf", "tw", "t")
+
+
+@dataclass(frozen=True)
+class ColumnSelection:
+    shape: str
+    wt_ft: float
+    phi_Pn: float
+    slenderness_x: float
+    slenderness_y: float
+
+
+class ColumnSelector:
+    """
+    Lightest W shape whose CompressedElement.phi_Pn carries Pu.
+    Sorted indexes on A, rx and ry discard, per column, every shape whose
+    squash load (0.9 Fy A) or KL/r < 200 limit already fails; shapes that
+    are locally slender are dropped once for the material. Survivors are
+    confirmed with compression_batch, lightest first.
+    Units follow the rest of megara: kip, in, ksi.
+    """
+
+    chunk = 512
+
+    def __init__(
+        self,
+        material: Steel,
+        catalog: SectionCatalog | None = None,
+        prefix: str = "W",
+    ):
+        self.material = material
+        self.prefix = prefix
+
+        df = _sorted_by_weight(catalog, prefix, _COLUMN_COLUMNS)
+        root = np.sqrt(material.E / material.Fy)
+        df = df.filter(
+            (pl.col("bf") / (2 * pl.col("tf")) < 0.56 * root)
+            & (pl.col("t") / pl.col("tw") < 1.49 * root)
+        )
+
+        self.shapes: np.ndarray = df.get_column("shape").to_numpy()
+        self.wt_ft: np.ndarray = df.get_column("wt_ft").to_numpy()
+        self.props: dict[str, np.ndarray] = {
+            name: df.get_column(name).cast(pl.Float64).to_numpy()
+            for name in _COLUMN_COLUMNS
+        }
+
+        # Sorted values and the rank of every shape within them
+        self.sorted: dict[str, np.ndarray] = {}
+        self.rank: dict[str, np.ndarray] = {}
+        for name in ("a", "rx", "ry"):
+            order = np.argsort(self.props[name], kind="stable")
+            self.sorted[name] = self.props[name][order]
+            self.rank[name] = np.empty_like(order)
+            self.rank[name][order] = np.arange(order.size)
+
+    def select(
+        self,
+        Pu: float,
+        L: float,
+        Kx: float,
+        Ky: float,
+    ) -> ColumnSelection | None:
+        return self.select_many(Pu, L, Kx, Ky)[0]
+
+    def select_many(self, Pu, L, Kx, Ky) -> list[ColumnSelection | None]:
+        demands = [
+            np.ravel(x)
+            for x in np.broadcast_arrays(
+                *(np.asarray(x, dtype=np.float64) for x in (Pu, L, Kx, Ky))
+            )
+        ]
+
+        selections: list[ColumnSelection | None] = []
+        for start in range(0, demands[0].size, self.chunk):
+            selections.extend(
+                self._select_chunk(*(x[start : start + self.chunk] for x in demands))
+            )
+        return selections
+
+    def _at_least(self, name: str, minimum: np.ndarray, strict: bool) -> np.ndarray:
+        side = "right" if strict else "left"
+        position = np.searchsorted(self.sorted[name], minimum, side=side)
+        return self.rank[name] >= position[:, None]
+
+    def _select_chunk(
+        self,
+        Pu: np.ndarray,
+        L: np.ndarray,
+        Kx: np.ndarray,
+        Ky: np.ndarray,
+    ) -> list[ColumnSelection | None]:
+        E, Fy = self.material.E, self.material.Fy
+
+        # ---- Pruning (columns × shapes)
+        mask = (
+            self._at_least("a", Pu / (0.9 * Fy), strict=False)
+            & self._at_least("rx", Kx * L / 200, strict=True)
+            & self._at_least("ry", Ky * L / 200, strict=True)
+        )
+
+        # ---- Full compression check on the survivors only
+        rows, cols = np.nonzero(mask)
+        compression = compression_batch(
+            **{k: v[cols] for k, v in self.props.items()},
+            L=L[rows],
+            Kx=Kx[rows],
+            Ky=Ky[rows],
+            Fy=Fy,
+            E=E,
+        )
+        passed = compression.phi_Pn >= Pu[rows]
+        first = _first_passing(rows, passed, Pu.size)
+
+        selections: list[ColumnSelection | None] = []
+        for c, k in enumerate(first):
+            if k < 0:
+                logger.warning(f"No {self.prefix} shape passes Pu={Pu[c]}")
+                selections.append(None)
+                continue
+
+            i = cols[k]
+            selections.append(
+                ColumnSelection(
+                    shape=str(self.shapes[i]),
+                    wt_ft=float(self.wt_ft[i]),
+                    phi_Pn=float(compression.phi_Pn[k]),
+                    slenderness_x=float(compression.slenderness_x[k]),
+                    slenderness_y=float(compression.slenderness_y[k]),
+                )
+            )
+        return selections
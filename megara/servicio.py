@@ -0,0 +1,318 @@
+import json
+import math
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from .lote import DEFAULTS, REQUIRED_COLUMNS, check_members, normalize_schedule
+from .secciones import SectionCatalog, catalog as default_catalog
+from .traza import set_quiet
+
+
+logger = logging.getLogger(__name__)
+
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+_COLUMNS = (*REQUIRED_COLUMNS, *DEFAULTS)
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+# ----------------
+# Micro-batching
+# ----------------
+
+
+class CheckBatcher:
+    """
+    Collects the members of concurrent requests for up to max_delay seconds
+    (or max_members members) and checks them with a single check_members
+    call, off the event loop so new requests keep queuing meanwhile. If the
+    batch fails, each request is checked on its own, so only the request
+    that fails by itself gets the error.
+    """
+
+    def __init__(
+        self,
+        catalog: SectionCatalog,
+        max_delay: float = 0.002,
+        max_members: int = 20_000,
+    ):
+        self.catalog = catalog
+        self.max_delay = max_delay
+        self.max_members = max_members
+        self._queue: asyncio.Queue[tuple[pl.DataFrame, asyncio.Future]] = (
+            asyncio.Queue()
+        )
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+
+    async def check(self, members: pl.DataFrame) -> pl.DataFrame:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((members, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            size = batch[0][0].height
+            deadline = loop.time() + self.max_delay
+
+            while size < self.max_members:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                batch.append(item)
+                size += item[0].height
+
+            frames = [members for members, _ in batch]
+            try:
+                result = await loop.run_in_executor(
+                    None, check_members, pl.concat(frames), self.catalog
+                )
+            except Exception:
+                logger.exception("Batch check failed, checking requests one by one")
+                await self._run_each(batch)
+                continue
+
+            offset = 0
+            for members, future in batch:
+                if not future.done():
+                    future.set_result(result.slice(offset, members.height))
+                offset += members.height
+
+            logger.debug(f"Checked {size} members from {len(batch)} requests")
+
+    async def _run_each(self, batch: list[tuple[pl.DataFrame, asyncio.Future]]) -> None:
+        # Only the requests that fail on their own get the error. Clients
+        # that disconnected meanwhile have their futures cancelled already
+        loop = asyncio.get_running_loop()
+        for members, future in batch:
+            if future.done():
+                continue
+            try:
+                result = await loop.run_in_executor(
+                    None, check_members, members, self.catalog
+                )
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+                continue
+            if not future.done():
+                future.set_result(result)
+
+
+# ----------------
+# Requests
+# ----------------
+
+
+def _parse_members(body: bytes, catalog: SectionCatalog) -> pl.DataFrame:
+    """
+    A member object or {"members": [...]}, with the columns of a lote
+    schedule. Unknown shapes are rejected here, before batching, so one
+    bad request cannot fail the others.
+    """
+    data = json.loads(body or b"{}")
+    members = data.get("members", [data]) if isinstance(data, dict) else data
+    if not members:
+        raise ValueError("No members in request")
+
+    df = normalize_schedule(pl.DataFrame(members), "request").select(_COLUMNS)
+
+    sections = catalog.section_table("wsmhp")
+    for shape in df.get_column("shape").unique().to_list():
+        sections.index(shape)
+
+    return df
+
+
+def _to_json(result: pl.DataFrame) -> list[dict[str, Any]]:
+    # JSON has no NaN or infinity: capacities that cannot be computed and
+    # ratios that cannot be met are sent as null
+    return [
+        {
+            k: None if isinstance(v, float) and not math.isfinite(v) else v
+            for k, v in row.items()
+        }
+        for row in result.iter_rows(named=True)
+    ]
+
+
+class DesignService:
+    """
+    Localhost HTTP/JSON front end for check_members.
+        - GET /health: catalog status
+        - POST /check: a member (or {"members": [...]}) → list of results
+    The catalog and its SectionTable are loaded once, at start-up.
+    """
+
+    def __init__(
+        self,
+        host: str = HOST,
+        port: int = PORT,
+        catalog: SectionCatalog | None = None,
+        max_delay: float = 0.002,
+    ):
+        self.host = host
+        self.port = port
+        self.catalog = catalog or default_catalog
+        self.batcher = CheckBatcher(self.catalog, max_delay=max_delay)
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        set_quiet()
+        start = time.perf_counter()
+        sections = self.catalog.section_table("wsmhp")
+        warm_up = pl.DataFrame(
+            {"name": ["warm-up"], "shape": [str(sections.shapes[0])], "L": [120.0]}
+        )
+        check_members(normalize_schedule(warm_up), self.catalog)
+        logger.info(f"▶ Catalog warm in {time.perf_counter() - start:.3f} s")
+
+        self.batcher.start()
+        # A large backlog so bursts of clients are not held back by SYN retries
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=1024
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"✔ Listening on http://{self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                status, payload = await self._route(method, target, body)
+
+                data = json.dumps(payload).encode()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                        "\r\n"
+                    ).encode()
+                    + data
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, target: str, body: bytes) -> tuple[int, Any]:
+        path = target.split("?", 1)[0]
+
+        if path == "/health":
+            if method != "GET":
+                return 405, {"error": f"{method} not allowed"}
+            return 200, {
+                "status": "ok",
+                "families": list(self.catalog.families),
+                "shapes": len(self.catalog.section_table("wsmhp")),
+            }
+
+        if path == "/check":
+            if method != "POST":
+                return 405, {"error": f"{method} not allowed"}
+            try:
+                members = _parse_members(body, self.catalog)
+            except (ValueError, TypeError, pl.exceptions.PolarsError) as error:
+                return 400, {"error": str(error)}
+            try:
+                result = await self.batcher.check(members)
+            except Exception as error:
+                logger.exception("Batch check failed")
+                return 500, {"error": str(error)}
+            return 200, _to_json(result)
+
+        return 404, {"error": f"Unknown path {path}"}
+
+
+# ----------------
+# Command line
+# ----------------
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m megara.servicio",
+        description="Local design-check service (HTTP/JSON on localhost).",
+    )
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--db", type=Path, default=None, help="sections.db path")
+    parser.add_argument(
+        "--max-delay", type=float, default=0.002, help="batching window, s"
+    )
+    args = parser.parse_args(argv)
+
+    service = DesignService(
+        port=args.port,
+        catalog=SectionCatalog(args.db) if args.db else None,
+        max_delay=args.max_delay,
+    )
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    from etc.settings import setup_logging
+
+    setup_logging()
+    main()
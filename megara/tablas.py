@@ -0,0 +1,367 @@
+import logging
+import threading
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from etc.paths import local_paths
+from .flexión import SLENDERNESS_CODES, Slenderness, flexure_batch
+from .compresión import critical_buckling_stress_batch
+from .secciones import SectionCatalog, catalog as default_catalog
+
+
+logger = logging.getLogger(__name__)
+
+
+STANDARD_FY: tuple[float, ...] = (36.0, 50.0)
+
+
+# ----------------
+# Beams (AISC Table 3-10)
+# ----------------
+
+_BEAM_COLUMNS = ("d", "tf", "tw", "bf", "ry", "sx", "zx", "j", "iy", "cw", "t")
+
+beam_curves_path = local_paths.db / "beam_curves.parquet"
+beam_limits_path = local_paths.db / "beam_limits.parquet"
+
+
+def build_beam_tables(
+    fy_values: tuple[float, ...] = STANDARD_FY,
+    E: float = 29_000,
+    Lb_max: float = 600,
+    n: int = 241,
+    catalog: SectionCatalog | None = None,
+    curves_path: Path = beam_curves_path,
+    limits_path: Path = beam_limits_path,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """
+    Precompute phi_Mn (cb = 1) against Lb for every W shape and Fy.
+    Lp and Lr are added to each shape's Lb grid, so the inelastic range
+    interpolates exactly. The limits table also keeps the section data, for
+    the closed-form elastic range. Units: kip, in.
+    """
+    df = (
+        (catalog or default_catalog)
+        .table("wsmhp")
+        .filter(pl.col("shape").str.starts_with("W"))
+        .drop_nulls(list(_BEAM_COLUMNS))
+    )
+    shapes = df.get_column("shape").to_numpy()
+    props = {
+        name: df.get_column(name).cast(pl.Float64).to_numpy()[:, None]
+        for name in _BEAM_COLUMNS
+    }
+    grid = np.linspace(0, Lb_max, n)
+
+    curves: list[pl.DataFrame] = []
+    limits: list[pl.DataFrame] = []
+
+    for Fy in fy_values:
+        logger.info(f"▶ Beam tables for Fy = {Fy}")
+
+        limit = flexure_batch(**props, Lb=0.0, cb=1.0, Fy=Fy, E=E)
+        Lp, Lr = limit.Lp[:, 0], limit.Lr[:, 0]
+
+        Lb = np.sort(
+            np.column_stack([np.broadcast_to(grid, (shapes.size, n)), Lp, Lr]),
+            axis=1,
+        )
+        Lb = np.minimum(Lb, Lb_max)
+        curve = flexure_batch(**props, Lb=Lb, cb=1.0, Fy=Fy, E=E)
+
+        curves.append(
+            pl.DataFrame(
+                {
+                    "shape": np.repeat(shapes, Lb.shape[1]),
+                    "fy": np.full(Lb.size, Fy),
+                    "lb": Lb.ravel(),
+                    "phi_mn": curve.phi_Mn.ravel(),
+                }
+            )
+        )
+        limits.append(
+            pl.DataFrame(
+                {
+                    "shape": shapes,
+                    "fy": np.full(shapes.size, Fy),
+                    "e": np.full(shapes.size, float(E)),
+                    "lp": Lp,
+                    "lr": Lr,
+                    "mp": limit.Mp[:, 0],
+                    "mr": limit.Mr[:, 0],
+                    "slenderness": [
+                        SLENDERNESS_CODES[code].value
+                        for code in limit.slenderness[:, 0]
+                    ],
+                    **{name: values[:, 0] for name, values in props.items()},
+                }
+            )
+        )
+
+    curves_df = pl.concat(curves)
+    limits_df = pl.concat(limits)
+
+    curves_df.write_parquet(curves_path)
+    limits_df.write_parquet(limits_path)
+    logger.info(f"✔ Beam tables written ({limits_df.height} shape/Fy pairs)")
+
+    return curves_df, limits_df
+
+
+class _DesignTable:
+    """
+    Precomputed curves and per-shape limits, read from Parquet once per
+    process. Curves are grouped by the curve key columns and sorted by x.
+    """
+
+    kind: str
+    curve_keys: tuple[str, ...]
+    x: str
+    y: str
+
+    def __init__(self, curves_path: Path, limits_path: Path):
+        self.curves_path = curves_path
+        self.limits_path = limits_path
+        self._curves: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+        self._limits: dict[tuple[str, float], dict] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def load(self) -> None:
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+
+            curves = pl.read_parquet(self.curves_path).sort(
+                [*self.curve_keys, self.x], maintain_order=True
+            )
+            for key, group in curves.group_by(list(self.curve_keys)):
+                self._curves[key] = (
+                    group.get_column(self.x).to_numpy(),
+                    group.get_column(self.y).to_numpy(),
+                )
+
+            for row in pl.read_parquet(self.limits_path).iter_rows(named=True):
+                self._limits[(row["shape"], row["fy"])] = row
+
+            self._loaded = True
+
+    def limits(self, shape: str, Fy: float = 36.0) -> dict:
+        self.load()
+        key = (shape, float(Fy))
+        if key not in self._limits:
+            raise KeyError(f"No {self.kind} table for {shape} with Fy = {Fy}")
+        return self._limits[key]
+
+
+class BeamDesignTable(_DesignTable):
+    """
+    Lookup of phi_Mn(shape, Lb, cb) from the precomputed beam tables,
+    loaded once per process.
+    The stored curve is for cb = 1 and is linear up to Lr, so interpolation
+    is exact there; cb scales it as FlexedElement.Mn does. Past Lr the
+    elastic Mn (a convex curve that interpolation would overestimate) is
+    evaluated in closed form from the stored section data, capped at Mp.
+    """
+
+    kind = "beam"
+    curve_keys = ("shape", "fy")
+    x = "lb"
+    y = "phi_mn"
+
+    def __init__(
+        self,
+        curves_path: Path = beam_curves_path,
+        limits_path: Path = beam_limits_path,
+    ):
+        super().__init__(curves_path, limits_path)
+
+    def phi_Mn(self, shape: str, Lb, cb=1.0, Fy: float = 36.0):
+        limits = self.limits(shape, Fy)
+        lb, phi_mn = self._curves[(shape, float(Fy))]
+
+        Lb = np.asarray(Lb, dtype=np.float64)
+        if np.any(Lb > lb[-1]):
+            raise ValueError(f"Lb beyond the table range (Lb_max = {lb[-1]}).")
+
+        phi_Mn_cb1 = np.interp(Lb, lb, phi_mn)
+
+        if limits["slenderness"] != Slenderness.compact.value:
+            return phi_Mn_cb1
+
+        elastic = flexure_batch(
+            **{name: limits[name] for name in _BEAM_COLUMNS},
+            Lb=Lb,
+            cb=cb,
+            Fy=Fy,
+            E=limits["e"],
+        ).phi_Mn
+
+        phi_Mp = 0.90 * limits["mp"]
+        return np.select(
+            [Lb <= limits["lp"], Lb <= limits["lr"]],
+            [phi_Mp, cb * phi_Mn_cb1],
+            default=elastic,
+        )
+
+
+beam_table = BeamDesignTable()
+
+
+# ----------------
+# Columns (AISC Table 4-1)
+# ----------------
+
+_COLUMN_COLUMNS = ("a", "rx", "ry", "bf", "tf", "tw", "t")
+
+column_curves_path = local_paths.db / "column_curves.parquet"
+column_limits_path = local_paths.db / "column_limits.parquet"
+
+
+def build_column_tables(
+    fy_values: tuple[float, ...] = STANDARD_FY,
+    E: float = 29_000,
+    n: int = 201,
+    catalog: SectionCatalog | None = None,
+    curves_path: Path = column_curves_path,
+    limits_path: Path = column_limits_path,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """
+    Precompute phi_Pn against effective length KL about each axis for every
+    W shape and Fy, up to KL/r = 200. The KL where the buckling curve
+    switches to the elastic branch is added to each grid. Locally slender
+    shapes, for which CompressedElement.Fcr raises, are flagged in the
+    limits table and have no curve. Units: kip, in.
+    """
+    df = (
+        (catalog or default_catalog)
+        .table("wsmhp")
+        .filter(pl.col("shape").str.starts_with("W"))
+        .drop_nulls(list(_COLUMN_COLUMNS))
+    )
+    shapes = df.get_column("shape").to_numpy()
+    p = {
+        name: df.get_column(name).cast(pl.Float64).to_numpy()
+        for name in _COLUMN_COLUMNS
+    }
+    grid = np.linspace(0, 200, n)
+
+    curves: list[pl.DataFrame] = []
+    limits: list[pl.DataFrame] = []
+
+    for Fy in fy_values:
+        logger.info(f"▶ Column tables for Fy = {Fy}")
+
+        root = np.sqrt(E / Fy)
+        local_slender = ~(
+            (p["bf"] / (2 * p["tf"]) < 0.56 * root) & (p["t"] / p["tw"] < 1.49 * root)
+        )
+        slenderness = np.append(grid, 4.71 * root)
+        slenderness = np.sort(slenderness[slenderness <= 200])
+        phi_Fcr = 0.9 * critical_buckling_stress_batch(slenderness, Fy, E)
+
+        keep = ~local_slender
+        for axis in ("x", "y"):
+            r = p[f"r{axis}"][keep]
+            curves.append(
+                pl.DataFrame(
+                    {
+                        "shape": np.repeat(shapes[keep], slenderness.size),
+                        "fy": np.full(r.size * slenderness.size, Fy),
+                        "axis": np.full(r.size * slenderness.size, axis),
+                        "kl": (r[:, None] * slenderness).ravel(),
+                        "phi_pn": (p["a"][keep][:, None] * phi_Fcr).ravel(),
+                    }
+                )
+            )
+
+        limits.append(
+            pl.DataFrame(
+                {
+                    "shape": shapes,
+                    "fy": np.full(shapes.size, Fy),
+                    "e": np.full(shapes.size, float(E)),
+                    "a": p["a"],
+                    "rx": p["rx"],
+                    "ry": p["ry"],
+                    "phi_pn_0": 0.9 * Fy * p["a"],
+                    "local_slender": local_slender,
+                }
+            )
+        )
+
+    curves_df = pl.concat(curves)
+    limits_df = pl.concat(limits)
+
+    curves_df.write_parquet(curves_path)
+    limits_df.write_parquet(limits_path)
+    logger.info(f"✔ Column tables written ({limits_df.height} shape/Fy pairs)")
+
+    return curves_df, limits_df
+
+
+class ColumnDesignTable(_DesignTable):
+    """
+    Lookup of phi_Pn(shape, KxL, KyL) from the precomputed column tables,
+    loaded once per process.
+    The inelastic branch (E3-2) is interpolated, within ±TOLERANCE of
+    CompressedElement.phi_Pn for the default grid, in either direction (the
+    curve changes concavity). Past the switch to E3-3 the convex elastic
+    branch, which interpolation would overestimate, is evaluated in closed
+    form. Returns NaN where CompressedElement.Fcr would raise (locally
+    slender shape, or KL/r not below 200 about either axis).
+    """
+
+    # Bound on the relative interpolation error of the inelastic branch for
+    # build_column_tables(n=201) (about 2e-5 measured over the W shapes)
+    TOLERANCE = 5e-5
+
+    kind = "column"
+    curve_keys = ("shape", "fy", "axis")
+    x = "kl"
+    y = "phi_pn"
+
+    def __init__(
+        self,
+        curves_path: Path = column_curves_path,
+        limits_path: Path = column_limits_path,
+    ):
+        super().__init__(curves_path, limits_path)
+
+    def _axis_phi_Pn(self, shape: str, Fy: float, axis: str, KL: np.ndarray):
+        limits = self._limits[(shape, float(Fy))]
+        slenderness = KL / limits[f"r{axis}"]
+        elastic = (
+            0.9
+            * limits["a"]
+            * critical_buckling_stress_batch(slenderness, Fy, limits["e"])
+        )
+        return np.where(
+            slenderness > 4.71 * np.sqrt(limits["e"] / Fy),
+            elastic,
+            np.interp(KL, *self._curves[(shape, float(Fy), axis)]),
+        )
+
+    def phi_Pn(self, shape: str, KxL, KyL, Fy: float = 36.0):
+        limits = self.limits(shape, Fy)
+        KxL, KyL = np.broadcast_arrays(
+            np.asarray(KxL, dtype=np.float64), np.asarray(KyL, dtype=np.float64)
+        )
+
+        if limits["local_slender"]:
+            return np.full(KxL.shape, np.nan)
+
+        phi_Pn = np.minimum(
+            self._axis_phi_Pn(shape, Fy, "x", KxL),
+            self._axis_phi_Pn(shape, Fy, "y", KyL),
+        )
+        valid = (KxL / limits["rx"] < 200) & (KyL / limits["ry"] < 200)
+        return np.where(valid, phi_Pn, np.nan)
+
+
+column_table = ColumnDesignTable()
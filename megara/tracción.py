@@ -0,0 +1,212 @@
+import logging
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from .definiciones import Element
+from .traza import Traced
+
+
+logger = logging.getLogger(__name__)
+
+
+class TensionValueNeeded(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class TensionedElement(Traced):
+    """
+    Element to be tensioned (AISC D2).
+        - element: brace or hanger to be checked for tensile strength
+        - An: net area at the connection (defaults to the gross area)
+        - U: shear lag factor, Ae = U * An (Table D3.1)
+    """
+
+    element: Element
+    An: float | None = None
+    U: float = 1.0
+
+    def __post_init__(self):
+        self._info(
+            "\n\n:: Applying tension to element %s...\n" + "-" * 45 + "\n",
+            self.element.name,
+        )
+
+    # ----------------
+    # Section geometry
+    # ----------------
+
+    @cached_property
+    def Ag(self) -> float:
+        if not self.element.section.a:
+            logger.error("Missing A")
+            raise TensionValueNeeded(
+                f'Missing parameter "A" for element {self.element.section.shape}'
+            )
+        self._record("Ag", self.element.section.a)
+        return self.element.section.a
+
+    @cached_property
+    def r(self) -> float:
+        # Least radius of gyration among those the section provides
+        section = self.element.section
+        radii = [r for r in (section.rx, section.ry, section.rz) if r]
+        if not radii:
+            logger.error("Missing r")
+            raise TensionValueNeeded(
+                f'Missing parameter "r" for element {self.element.section.shape}'
+            )
+        value = min(radii)
+        self._record("r min", value)
+        return value
+
+    @cached_property
+    def Ae(self) -> float:
+        An = self.Ag if self.An is None else self.An
+        value = self.U * An
+        self._record("An", An)
+        self._record("U", self.U)
+        self._record("Ae", value)
+        return value
+
+    # ----------------
+    # Element / material
+    # ----------------
+
+    @cached_property
+    def L(self) -> float:
+        if not self.element.L:
+            logger.error("Missing L")
+            raise TensionValueNeeded(
+                f'Missing parameter "L" for element {self.element.section.shape}'
+            )
+        self._record("L", self.element.L)
+        return self.element.L
+
+    @cached_property
+    def Fy(self) -> float:
+        if not self.element.material.Fy:
+            logger.error("Missing Fy")
+            raise TensionValueNeeded(
+                f'Missing parameter "Fy" for element {self.element.section.shape}'
+            )
+        self._record("Fy", self.element.material.Fy)
+        return self.element.material.Fy
+
+    @cached_property
+    def Fu(self) -> float:
+        if not self.element.material.Fu:
+            logger.error("Missing Fu")
+            raise TensionValueNeeded(
+                f'Missing parameter "Fu" for element {self.element.section.shape}'
+            )
+        self._record("Fu", self.element.material.Fu)
+        return self.element.material.Fu
+
+    # ----------------
+    # Slenderness (D1, advisory)
+    # ----------------
+
+    @cached_property
+    def slenderness(self) -> float:
+        value = self.L / self.r
+        self._record("L/r", value)
+        return value
+
+    def slenderness_test(self) -> bool:
+        # D1 recommends L/r <= 300; it does not apply to rods or hangers
+        if self.slenderness <= 300:
+            self._info(">> Slenderness L/r <= 300.")
+            return True
+        logger.warning(
+            f"L/r = {self.slenderness:.1f} > 300 for element {self.element.name} "
+            "(D1 recommendation, not a limit state)"
+        )
+        return False
+
+    # ----------------
+    # Limit states
+    # ----------------
+
+    @cached_property
+    def phi_Pn_yielding(self) -> float:
+        # D2(a): tensile yielding in the gross section
+        value = 0.90 * self.Fy * self.Ag
+        self._record("ɸPn yielding", value)
+        return value
+
+    @cached_property
+    def phi_Pn_rupture(self) -> float:
+        # D2(b): tensile rupture in the net section
+        value = 0.75 * self.Fu * self.Ae
+        self._record("ɸPn rupture", value)
+        return value
+
+    @cached_property
+    def phi_Tn(self) -> float:
+        value = min(self.phi_Pn_yielding, self.phi_Pn_rupture)
+        self._record("ɸTn", value)
+        self._record(
+            "Governing",
+            "yielding" if value == self.phi_Pn_yielding else "rupture",
+        )
+        return value
+
+
+# ----------------
+# Batch
+# ----------------
+
+
+@dataclass(frozen=True)
+class TensionBatch:
+    """
+    Columnar result of tension_batch; every field is an array with the
+    broadcast shape of the inputs.
+        - rupture_governs: phi_Pn_rupture < phi_Pn_yielding
+        - slender: L/r above the D1 recommendation of 300
+    """
+
+    Ae: np.ndarray
+    phi_Pn_yielding: np.ndarray
+    phi_Pn_rupture: np.ndarray
+    phi_Tn: np.ndarray
+    rupture_governs: np.ndarray
+    slenderness: np.ndarray
+    slender: np.ndarray
+
+
+def tension_batch(a, r, L, Fy, Fu, An=None, U=1.0) -> TensionBatch:
+    """
+    Vectorized counterpart of TensionedElement.phi_Tn.
+        - r: least radius of gyration
+        - An: net area; None or NaN for the gross area
+    Missing data propagates as NaN instead of raising TensionValueNeeded.
+    """
+    An = np.nan if An is None else An
+    a, r, L, Fy, Fu, An, U = (
+        np.asarray(x, dtype=np.float64)
+        for x in np.broadcast_arrays(a, r, L, Fy, Fu, An, U)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Ae = U * np.where(np.isnan(An), a, An)
+        phi_Pn_yielding = 0.90 * Fy * a
+        phi_Pn_rupture = 0.75 * Fu * Ae
+        slenderness = L / r
+
+    return TensionBatch(
+        Ae=Ae,
+        phi_Pn_yielding=phi_Pn_yielding,
+        phi_Pn_rupture=phi_Pn_rupture,
+        phi_Tn=np.minimum(phi_Pn_yielding, phi_Pn_rupture),
+        rupture_governs=phi_Pn_rupture < phi_Pn_yielding,
+        slenderness=slenderness,
+        slender=slenderness > 300,
+    )
+
+
+if __name__ == "__main__":
+    pass
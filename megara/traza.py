@@ -0,0 +1,78 @@
+import logging
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Any, Iterator
+
+
+# ----------------
+# Quiet mode
+# ----------------
+
+_quiet = False
+
+
+def set_quiet(value: bool = True) -> None:
+    """
+    In quiet mode the limit-state classes skip building and emitting their
+    log messages; intermediate values still go to each element's trace.
+    """
+    global _quiet
+    _quiet = value
+
+
+def is_quiet() -> bool:
+    return _quiet
+
+
+@contextmanager
+def quiet() -> Iterator[None]:
+    previous = _quiet
+    set_quiet(True)
+    try:
+        yield
+    finally:
+        set_quiet(previous)
+
+
+# ----------------
+# Calculation trace
+# ----------------
+
+
+class CalcTrace(dict):
+    """
+    Intermediate values of one element's calculation (name → value), in
+    the order they were computed.
+    """
+
+    def to_text(self) -> str:
+        return "\n".join(f"{name} : {value}" for name, value in self.items())
+
+
+class Traced:
+    """
+    Mixin for the limit-state classes: records every intermediate value in
+    `trace` and logs it unless quiet mode is on. Messages are only
+    formatted when they are actually emitted.
+    """
+
+    @cached_property
+    def trace(self) -> CalcTrace:
+        return CalcTrace()
+
+    @cached_property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(type(self).__module__)
+
+    def _record(self, name: str, value: Any) -> None:
+        self.trace[name] = value
+        if not _quiet:
+            self._logger.info("%s : %s", name, value)
+
+    def _info(self, msg: str, *args: Any) -> None:
+        if not _quiet:
+            self._logger.info(msg, *args)
+
+    def _debug(self, msg: str, *args: Any) -> None:
+        if not _quiet:
+            self._logger.debug(msg, *args)
@@ -0,0 +1,226 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .formulas import cb_from_diagram
+
+
+# ----------------
+# Beam analysis (initial-parameter method)
+# ----------------
+#
+# Prismatic single-span beams, x measured from the left end (the fixed end
+# of cantilever and propped beams). Loads are positive downward; shear is
+# positive when the left-hand side pushes up, moment positive in sagging
+# and deflection positive upward, so a loaded simple beam has M > 0, y < 0.
+# Units: kip, in (w in kip/in, EI in kip-in²).
+
+SUPPORTS = ("simple", "cantilever", "fixed", "propped")
+
+
+@dataclass(frozen=True)
+class BeamBatch:
+    """
+    Diagrams of n beams at N equally spaced stations (n × N arrays), and
+    their end reactions (n,). y is NaN where EI was not given.
+    """
+
+    L: np.ndarray
+    support: np.ndarray
+    x: np.ndarray
+    V: np.ndarray
+    M: np.ndarray
+    y: np.ndarray
+    R_left: np.ndarray
+    R_right: np.ndarray
+    M_left: np.ndarray
+    M_right: np.ndarray
+
+    @property
+    def V_max(self) -> np.ndarray:
+        """Largest |V| of each beam (Vu for the shear checks)."""
+        return np.abs(self.V).max(axis=1)
+
+    @property
+    def M_max(self) -> np.ndarray:
+        """Largest |M| of each beam (Mu for the flexure checks)."""
+        return np.abs(self.M).max(axis=1)
+
+    @property
+    def M_positive(self) -> np.ndarray:
+        return np.maximum(self.M.max(axis=1), 0.0)
+
+    @property
+    def M_negative(self) -> np.ndarray:
+        return np.minimum(self.M.min(axis=1), 0.0)
+
+    @property
+    def y_max(self) -> np.ndarray:
+        """Largest |y| of each beam."""
+        return np.abs(self.y).max(axis=1)
+
+    def deflection_ratio(self, divisor: float = 360) -> np.ndarray:
+        """y_max over the L/divisor limit (as in FlexedElement.deflection_test)."""
+        return self.y_max / (self.L / divisor)
+
+    def cb(self, braces=()) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Lb and Cb (n × n_segments) of the segments between braces, given
+        as fractions of the span shared by every beam; the supports brace
+        both ends except the free end of a cantilever, whose segment takes
+        Cb = 1 (F1).
+        """
+        t = self.x[0] / self.L[0]
+        Lb, cb = cb_from_diagram(t, self.M, braces)
+        cb[self.support == "cantilever", -1] = 1.0
+        return self.L[:, None] * Lb, cb
+
+
+def _load_terms(x, P, a, w, start, end):
+    """
+    Shear, moment and EI-scaled slope and deflection of the loads alone, on
+    a beam free at x = 0 (Macaulay brackets).
+    """
+    d = x[:, :, None] - a[:, None, :]
+    h = d >= 0
+    dp = np.where(h, d, 0.0)
+    P = P[:, None, :]
+
+    ds = np.maximum(x[:, :, None] - start[:, None, :], 0.0)
+    de = np.maximum(x[:, :, None] - end[:, None, :], 0.0)
+    w = w[:, None, :]
+
+    V = -(P * h).sum(axis=2) - (w * (ds - de)).sum(axis=2)
+    M = -(P * dp).sum(axis=2) - (w * (ds**2 - de**2)).sum(axis=2) / 2
+    T = -(P * dp**2).sum(axis=2) / 2 - (w * (ds**3 - de**3)).sum(axis=2) / 6
+    Y = -(P * dp**3).sum(axis=2) / 6 - (w * (ds**4 - de**4)).sum(axis=2) / 24
+    return V, M, T, Y
+
+
+def _initial_parameters(support, L, V_L, M_L, T_L, Y_L):
+    """
+    Shear, moment and EI-scaled slope at x = 0 that meet the boundary
+    conditions of each support, from the load terms at x = L.
+    """
+    simple = support == "simple"
+    cantilever = support == "cantilever"
+    fixed = support == "fixed"
+    propped = support == "propped"
+
+    V0 = np.select(
+        [simple, cantilever, fixed, propped],
+        [
+            -M_L / L,
+            -V_L,
+            12 * Y_L / L**3 - 6 * T_L / L**2,
+            3 * (Y_L - M_L * L**2 / 2) / L**3,
+        ],
+    )
+    M0 = np.select(
+        [cantilever, fixed, propped],
+        [-(V0 * L + M_L), 2 * T_L / L - 6 * Y_L / L**2, -M_L - V0 * L],
+        0.0,
+    )
+    T0 = np.where(simple, -(V0 * L**3 / 6 + Y_L) / L, 0.0)
+    return V0, M0, T0
+
+
+def _loads(values, n: int, k: int = 0) -> np.ndarray:
+    # (n × k) per beam, or (k,) shared by every beam
+    if values is None:
+        return np.zeros((n, k))
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    return np.broadcast_to(values, (n, values.shape[1]))
+
+
+def beam_batch(
+    L,
+    support="simple",
+    q=0.0,
+    P=None,
+    a=None,
+    w=None,
+    start=None,
+    end=None,
+    EI=np.nan,
+    stations: int = 101,
+    chunk: int = 4096,
+) -> BeamBatch:
+    """
+    Shear, moment and deflection diagrams of many beams in one pass.
+        - L, support, q, EI: (n,) or scalars; support is one of SUPPORTS and
+          q a uniform load over the whole span
+        - P, a: point loads and their distance from the left end
+        - w, start, end: partial uniform loads between start and end
+          (start defaults to 0 and end to L)
+    Load arguments are (n × k) per beam, or (k,) shared by every beam.
+    Beams are solved chunk at a time to bound temporaries.
+    """
+    L = np.atleast_1d(np.asarray(L, dtype=np.float64))
+    support = np.atleast_1d(np.asarray(support, dtype=str))
+    n = max(L.size, support.size, np.size(q), np.size(EI))
+    L, q, EI = (np.broadcast_to(np.asarray(x, dtype=np.float64), n) for x in (L, q, EI))
+    support = np.broadcast_to(support, n)
+
+    unknown = set(support.tolist()) - set(SUPPORTS)
+    if unknown:
+        raise ValueError(f"Unknown supports {sorted(unknown)}, expected {SUPPORTS}")
+
+    if (P is None) != (a is None):
+        raise ValueError("Point loads need both P and a")
+
+    P = _loads(P, n)
+    a = _loads(a, n, P.shape[1])
+    w = _loads(w, n)
+    start = _loads(start, n, w.shape[1])
+    end = np.broadcast_to(L[:, None], w.shape) if end is None else _loads(end, n)
+    if P.shape != a.shape or not w.shape == start.shape == end.shape:
+        raise ValueError("Load magnitudes and positions do not match")
+
+    # The uniform load is one more partial load, over the whole span
+    w = np.hstack([w, q[:, None]])
+    start = np.hstack([start, np.zeros((n, 1))])
+    end = np.hstack([end, L[:, None]])
+
+    x = L[:, None] * np.linspace(0.0, 1.0, stations)
+    V, M, y = (np.empty((n, stations)) for _ in range(3))
+    R_left, R_right, M_left, M_right = (np.empty(n) for _ in range(4))
+
+    for begin in range(0, n, chunk):
+        rows = slice(begin, begin + chunk)
+        loads = (P[rows], a[rows], w[rows], start[rows], end[rows])
+        span = L[rows]
+
+        V_L, M_L, T_L, Y_L = (t[:, 0] for t in _load_terms(span[:, None], *loads))
+        V0, M0, T0 = _initial_parameters(support[rows], span, V_L, M_L, T_L, Y_L)
+
+        s = x[rows]
+        Vl, Ml, _, Yl = _load_terms(s, *loads)
+        V[rows] = V0[:, None] + Vl
+        M[rows] = M0[:, None] + V0[:, None] * s + Ml
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y[rows] = (
+                T0[:, None] * s + M0[:, None] * s**2 / 2 + V0[:, None] * s**3 / 6 + Yl
+            ) / EI[rows, None]
+
+        R_left[rows] = V0
+        R_right[rows] = -(V0 + V_L)
+        M_left[rows] = M0
+        M_right[rows] = M0 + V0 * span + M_L
+
+    return BeamBatch(
+        L=L,
+        support=support,
+        x=x,
+        V=V,
+        M=M,
+        y=y,
+        R_left=R_left,
+        R_right=R_right,
+        M_left=M_left,
+        M_right=M_right,
+    )
+
+
+if __name__ == "__main__":
+    pass
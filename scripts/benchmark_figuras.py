@@ -0,0 +1,77 @@
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+from etc.paths import local_paths
+from megara.definiciones import Element, Steel
+from megara.figuras import _render, save_curves
+from megara.flexión import FlexedElement
+from megara.secciones import SectionCatalog, catalog as default_catalog
+from megara.traza import set_quiet
+
+FIGURES = 20
+DPI = 150
+
+
+def _elements(n: int, catalog: SectionCatalog) -> list[FlexedElement]:
+    sections = catalog.section_table("wsmhp")
+    material = Steel(29000, 50)
+    return [
+        FlexedElement(
+            Element(f"B-{i}", material, sections.to_section(i % len(sections)), 240),
+            Lb=60 + i,
+            cb=1.0,
+        )
+        for i in range(n)
+    ]
+
+
+def _per_figure(render, elements) -> float:
+    start = time.perf_counter()
+    for element in elements:
+        render(element)
+    return (time.perf_counter() - start) / len(elements)
+
+
+def benchmark(
+    n: int = FIGURES,
+    dpi: int = DPI,
+    catalog: SectionCatalog | None = None,
+) -> None:
+    """
+    Seconds per flexure figure, in one process: a new pyplot figure per
+    element (save_Mn_curve) against the reused template of figuras, and
+    save_curves end to end (process start-up included).
+    """
+    set_quiet()
+    catalog = catalog or default_catalog
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+
+        # Warm both paths (imports, fonts, first template)
+        _elements(1, catalog)[0].save_Mn_curve(dpi=dpi)
+        _render(_elements(1, catalog)[0], directory, dpi)
+
+        old = _per_figure(lambda e: e.save_Mn_curve(dpi=dpi), _elements(n, catalog))
+        # save_Mn_curve always writes to the cache folder
+        for i in range(n):
+            (local_paths.cache / f"B-{i}_flexure.png").unlink(missing_ok=True)
+        new = _per_figure(lambda e: _render(e, directory, dpi), _elements(n, catalog))
+
+        start = time.perf_counter()
+        list(save_curves(_elements(n, catalog), directory, dpi=dpi))
+        pool = (time.perf_counter() - start) / n
+
+    print(f"save_Mn_curve loop: {old:.3f} s/figure")
+    print(f"template reuse:     {new:.3f} s/figure ({old / new:.2f}x)")
+    print(f"save_curves:        {pool:.3f} s/figure (pool start-up included)")
+
+
+def ejemplo():
+    benchmark(catalog=SectionCatalog(sys.argv[1]) if len(sys.argv) > 1 else None)
+
+
+if __name__ == "__main__":
+    ejemplo()
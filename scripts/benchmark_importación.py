@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+CORE_MODULES = (
+    "megara.flexión",
+    "megara.compresión",
+    "megara.cortante",
+    "megara.combinaciones",
+)
+
+# Modules that must not be loaded by the calculation path
+FORBIDDEN = ("matplotlib", "yaml", "etc.settings")
+
+BUDGET = 0.5  # seconds, on top of a bare interpreter start
+RUNS = 5
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _best_time(code: str) -> float:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=_ROOT)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(budget: float = BUDGET) -> bool:
+    imports = "; ".join(f"import {module}" for module in CORE_MODULES)
+    check = (
+        f"{imports}; import sys; "
+        f"loaded = [m for m in {FORBIDDEN!r} if m in sys.modules]; "
+        "sys.exit(f'Loaded on import: {loaded}') if loaded else None"
+    )
+
+    baseline = _best_time("pass")
+    elapsed = _best_time(check) - baseline
+
+    print(f"Core import time: {elapsed:.3f} s (budget {budget:.3f} s)")
+    return elapsed <= budget
+
+
+def ejemplo():
+    if not benchmark():
+        sys.exit("Import time budget exceeded.")
+
+
+if __name__ == "__main__":
+    ejemplo()
@@ -1,7 +1,9 @@
 from megara.definiciones import Steel, Element, Section
 from megara.secciones import read_wshmp_section
 
-from megara.formulas import moment_beam
+import numpy as np
+
+from megara.formulas import moment_beam, cb_from_diagram
 from megara.predimensionamiento import peralte_viga, wt_viga
 
 from megara.flexión import FlexedElement
@@ -44,7 +46,10 @@ def ejemplo():
     section = Section(**section)
     element = Element("B-1", material, section, largo_viga * 100 / 2.54)
     Lb = 200 / 2.54 / 12  # 3 arriostres, en inches
-    flexed_element = FlexedElement(element, Lb, 1)  # debería ser cb = 1.01 :shrug:
+    x = np.linspace(0, largo_viga, 61)
+    _, cb = cb_from_diagram(x, w_servicio * x * (largo_viga - x) / 2, [2, 4])
+    cb = cb[0, 1]  # tramo central, el de mayor momento (cb = 1.01)
+    flexed_element = FlexedElement(element, Lb, cb)
     flexed_element.show_Mn_curve()
 
     phi_Mn = flexed_element.phi_Mn / 12  # kip-ft